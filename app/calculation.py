@@ -2,40 +2,62 @@
 Calculation class to represent a single calculation.
 """
 
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Union
 
+def _to_epoch_us(dt: datetime) -> int:
+    """Convert a datetime to integer microseconds since the epoch."""
+    # Whole seconds go through timestamp(); microseconds are added exactly
+    return int(dt.replace(microsecond=0).timestamp()) * 1_000_000 + dt.microsecond
+
+def _now_us() -> int:
+    """Current time in integer microseconds since the epoch."""
+    return time.time_ns() // 1000
+
+@dataclass(slots=True, eq=False)
 class Calculation:
-    """Represents a single calculation with operation and operands."""
-    
-    def __init__(self, operation: str, operand1: float, operand2: float, 
-                 result: float, timestamp: Optional[datetime] = None):
-        """
-        Initialize a Calculation.
-        
-        Args:
-            operation: The operation performed
-            operand1: First operand
-            operand2: Second operand
-            result: Result of the calculation
-            timestamp: When the calculation was performed
-        """
-        self.operation = operation
-        self.operand1 = operand1
-        self.operand2 = operand2
-        self.result = result
-        self.timestamp = timestamp or datetime.now()
+    """
+    Represents a single calculation with operation and operands.
+    
+    Instances are slotted (no per-instance __dict__), since history can
+    hold many of them, and compare by identity.
+    
+    Attributes:
+        operation: The operation performed
+        operand1: First operand
+        operand2: Second operand
+        result: Result of the calculation
+        timestamp: When the calculation was performed, as microseconds
+            since the epoch; a datetime or None (now) is also accepted
+            and converted on construction
+    """
+    
+    operation: str
+    operand1: float
+    operand2: float
+    result: float
+    # Stored as epoch microseconds so saving and loading history
+    # never has to format or parse ISO 8601 strings
+    timestamp: int = field(default_factory=_now_us)
+    
+    def __post_init__(self):
+        """Normalize a datetime or None timestamp to epoch microseconds."""
+        timestamp = self.timestamp
+        if not isinstance(timestamp, int):
+            self.timestamp = _now_us() if timestamp is None else _to_epoch_us(timestamp)
+    
+    @property
+    def timestamp_dt(self) -> datetime:
+        """The timestamp as a local datetime, for display."""
+        seconds, micros = divmod(self.timestamp, 1_000_000)
+        return datetime.fromtimestamp(seconds).replace(microsecond=micros)
     
     def __str__(self) -> str:
         """String representation of the calculation."""
         return f"{self.operand1} {self.operation} {self.operand2} = {self.result}"
     
-    def __repr__(self) -> str:
-        """Detailed representation of the calculation."""
-        return (f"Calculation(operation='{self.operation}', "
-                f"operand1={self.operand1}, operand2={self.operand2}, "
-                f"result={self.result}, timestamp={self.timestamp})")
-    
     def to_dict(self) -> dict:
         """Convert calculation to dictionary."""
         return {
@@ -43,16 +65,28 @@ class Calculation:
             'operand1': self.operand1,
             'operand2': self.operand2,
             'result': self.result,
-            'timestamp': self.timestamp.isoformat()
+            'timestamp': self.timestamp
         }
     
     @classmethod
     def from_dict(cls, data: dict) -> 'Calculation':
         """Create Calculation from dictionary."""
+        # Called once per row when loading history: bind the converters
+        # locally and construct positionally instead of by keyword
+        to_float = float
         return cls(
-            operation=data['operation'],
-            operand1=float(data['operand1']),
-            operand2=float(data['operand2']),
-            result=float(data['result']),
-            timestamp=datetime.fromisoformat(data['timestamp'])
-        )
\ No newline at end of file
+            data['operation'],
+            to_float(data['operand1']),
+            to_float(data['operand2']),
+            to_float(data['result']),
+            cls.parse_timestamp(data['timestamp'])
+        )
+    
+    @staticmethod
+    def parse_timestamp(value) -> Union[int, datetime]:
+        """Parse a stored timestamp: epoch microseconds or an ISO 8601 string."""
+        try:
+            return int(value)
+        except ValueError:
+            # History written before timestamps were stored as integers
+            return datetime.fromisoformat(value)
\ No newline at end of file
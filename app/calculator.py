@@ -2,18 +2,22 @@
 Main Calculator class with observer pattern implementation.
 """
 
+import atexit
+import functools
+import time
+import weakref
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, TextIO, Tuple, Union
 from abc import ABC, abstractmethod
 from app.calculation import Calculation
-from app.operations import OperationFactory
+from app.operations import Operation, OperationFactory
 from app.history import HistoryManager
-from app.calculator_momento import CalculatorMemento, MementoCaretaker
-from app.input_validator import InputValidator
+from app.calculator_momento import CalculatorMemento, MementoCaretaker, MementoOp
 from app.calculator_config import config
 from app.logger import Logger
-from app.exceptions import CalculatorError
-import pandas as pd
+from app.exceptions import (
+    CalculatorError, DivisionByZeroError, OperationError, ValidationError
+)
 
 class CalculatorObserver(ABC):
     """Abstract base class for calculator observers."""
@@ -34,20 +38,100 @@ class LoggingObserver(CalculatorObserver):
         self.logger.log_calculation(calculation)
 
 class AutoSaveObserver(CalculatorObserver):
-    """Observer that auto-saves history to CSV."""
+    """Observer that auto-saves history to CSV in batches."""
+    
+    # Maximum number of seconds unsaved calculations may sit in memory
+    FLUSH_INTERVAL = 1.0
     
     def __init__(self, history_manager: HistoryManager):
         self.history_manager = history_manager
         self.logger = Logger()
+        self._pending: List[Calculation] = []
+        # The file is rewritten in full on the first save and after any change
+        # other than a plain append; otherwise new calculations are appended
+        self._needs_rewrite = True
+        self._last_flush_ts = time.monotonic()
+        _auto_save_observers.add(self)
     
     def update(self, calculation: Calculation):
-        """Auto-save history if enabled."""
+        """Auto-save history if enabled, coalescing bursts into one write."""
         if config.auto_save:
-            try:
+            self._pending.append(calculation)
+            if (len(self._pending) >= config.autosave_batch_size or
+                    time.monotonic() - self._last_flush_ts > self.FLUSH_INTERVAL):
+                self.flush()
+    
+    def request_rewrite(self):
+        """Rewrite the whole file on the next flush instead of appending."""
+        self._needs_rewrite = True
+    
+    def flush(self):
+        """Write any unsaved calculations to the history file."""
+        if not self._pending:
+            return
+        try:
+            if self._needs_rewrite or not self.history_manager.can_append():
                 self.history_manager.save_to_csv()
-                self.logger.debug("History auto-saved")
-            except Exception as e:
-                self.logger.error(f"Auto-save failed: {e}")
+                self._needs_rewrite = False
+            else:
+                self.history_manager.append_to_csv(self._pending)
+            self.logger.debug("History auto-saved")
+        except Exception as e:
+            self.logger.error("Auto-save failed: %s", e)
+        finally:
+            self._pending = []
+            self._last_flush_ts = time.monotonic()
+
+# Live auto-save observers, flushed at interpreter exit so no batch is lost
+_auto_save_observers: "weakref.WeakSet[AutoSaveObserver]" = weakref.WeakSet()
+
+@atexit.register
+def _flush_auto_save_observers():
+    """Flush every auto-save observer that is still alive."""
+    for observer in list(_auto_save_observers):
+        observer.flush()
+
+@functools.lru_cache(maxsize=256, typed=True)
+def _compute(operation: Operation, operand1: float, operand2: float,
+             precision: int) -> float:
+    """Execute a pure operation and round the result, memoizing recent calls."""
+    return round(operation.execute(operand1, operand2), precision)
+
+# Operations that reject a zero second operand, with the scalar error message
+_ZERO_DIVISOR_ERRORS = {
+    'divide': "Cannot divide by zero",
+    'root': "Cannot calculate root with zero index",
+    'modulus': "Cannot calculate modulus with zero divisor",
+    'int_divide': "Cannot divide by zero",
+    'percent': "Cannot calculate percentage with zero base",
+}
+
+def _batch_root(np, a, b):
+    """Element-wise RootOperation with the same domain checks."""
+    if np.any(b < 0):
+        raise OperationError("Cannot calculate root with negative degree")
+    odd_negative = (a < 0) & (b % 2 == 1)
+    if np.any((a < 0) & ~odd_negative):
+        raise OperationError("Cannot calculate even root of negative number")
+    return np.where(odd_negative, -1.0, 1.0) * np.abs(a) ** (1 / b)
+
+@functools.lru_cache(maxsize=None)
+def _batch_functions() -> Dict[str, Callable]:
+    """Map operation names to NumPy ufuncs (NumPy is imported on first use)."""
+    import numpy as np
+    
+    return {
+        'add': np.add,
+        'subtract': np.subtract,
+        'multiply': np.multiply,
+        'divide': np.divide,
+        'power': np.power,
+        'root': functools.partial(_batch_root, np),
+        'modulus': np.mod,
+        'int_divide': np.floor_divide,
+        'percent': lambda a, b: np.divide(a, b) * 100,
+        'abs_diff': lambda a, b: np.abs(np.subtract(a, b)),
+    }
 
 class Calculator:
     """Main calculator class with observer pattern."""
@@ -57,36 +141,89 @@ class Calculator:
         self.history_manager = HistoryManager()
         self.memento_caretaker = MementoCaretaker()
         self.logger = Logger()
-        self._observers: List[CalculatorObserver] = []
+        # Ordered mapping of observer -> bound update method; the tuple is
+        # rebuilt on (un)registration so notification only iterates it
+        self._observers: Dict[CalculatorObserver, Callable[[Calculation], None]] = {}
+        self._observer_updates: Tuple[Callable[[Calculation], None], ...] = ()
+        # Precision is fixed for the lifetime of the calculator
+        self._precision: int = config.precision
+        # Operations are stateless, so each one is created once and reused
+        self._operation_cache: Dict[str, Tuple[Operation, str]] = {}
+        self._auto_save_observer = AutoSaveObserver(self.history_manager)
         
         # Register default observers
         self.register_observer(LoggingObserver())
-        self.register_observer(AutoSaveObserver(self.history_manager))
+        self.register_observer(self._auto_save_observer)
         
         # Save initial state
-        self._save_state()
+        self._save_state(CalculatorMemento.CHECKPOINT)
     
     def register_observer(self, observer: CalculatorObserver):
-        """Register an observer."""
-        self._observers.append(observer)
+        """
+        Register an observer. Registering the same observer twice has no effect.
+        
+        Raises:
+            TypeError: If the observer has no callable update method
+        """
+        update = getattr(observer, 'update', None)
+        if not callable(update):
+            raise TypeError(f"Observer {observer!r} has no callable update method")
+        if observer not in self._observers:
+            self._observers[observer] = update
+            self._observer_updates = tuple(self._observers.values())
     
     def unregister_observer(self, observer: CalculatorObserver):
         """Unregister an observer."""
-        if observer in self._observers:
-            self._observers.remove(observer)
+        if self._observers.pop(observer, None) is not None:
+            self._observer_updates = tuple(self._observers.values())
     
     def _notify_observers(self, calculation: Calculation):
         """Notify all observers of a new calculation."""
-        for observer in self._observers:
+        if not self._observer_updates:
+            return
+        for update in self._observer_updates:
             try:
-                observer.update(calculation)
+                update(calculation)
             except Exception as e:
-                self.logger.error(f"Observer notification failed: {e}")
+                self.logger.error("Observer notification failed: %s", e)
+    
+    def _save_state(self, op: MementoOp, payload=None):
+        """Record a history change as a memento for undo/redo."""
+        self.memento_caretaker.save(CalculatorMemento(op, payload))
+    
+    def _revert(self, memento: CalculatorMemento):
+        """Apply the inverse of a recorded history change."""
+        history_manager = self.history_manager
+        if memento.op == CalculatorMemento.ADD:
+            _, evicted = memento.get_state()
+            history_manager.restore_to_length(len(history_manager) - 1)
+            if evicted is not None:
+                history_manager.prepend_calculation(evicted)
+        elif memento.op == CalculatorMemento.CLEAR:
+            history_manager.append_calculations(memento.get_state())
+        else:
+            before, _ = memento.get_state()
+            history_manager.set_history(before)
     
-    def _save_state(self):
-        """Save current state to memento."""
-        memento = CalculatorMemento(self.history_manager.get_history())
-        self.memento_caretaker.save(memento)
+    def _reapply(self, memento: CalculatorMemento):
+        """Apply a recorded history change again."""
+        if memento.op == CalculatorMemento.ADD:
+            calculation, _ = memento.get_state()
+            self.history_manager.add_calculation(calculation)
+        elif memento.op == CalculatorMemento.CLEAR:
+            self.history_manager.restore_to_length(0)
+        else:
+            _, loaded = memento.get_state()
+            self.history_manager.set_history(loaded)
+    
+    def _get_operation(self, operation_name: str) -> Tuple[Operation, str]:
+        """Get a cached operation instance and its symbol by name."""
+        cached = self._operation_cache.get(operation_name)
+        if cached is None:
+            operation = OperationFactory.create_operation(operation_name)
+            cached = (operation, operation.get_symbol())
+            self._operation_cache[operation_name] = cached
+        return cached
     
     def calculate(self, operation_name: str, operand1: float, operand2: float) -> float:
         """
@@ -96,45 +233,116 @@ class Calculator:
             operation_name: Name of the operation
             operand1: First operand
             operand2: Second operand
-            
+        
         Returns:
             Result of the calculation
-            
+        
         Raises:
             CalculatorError: If calculation fails
         """
+        # Look up operation (created through the factory on first use);
+        # unknown names raise OperationError from the factory
+        operation, symbol = self._get_operation(operation_name)
+        
         try:
-            # Create operation using factory
-            operation = OperationFactory.create_operation(operation_name)
-            
-            # Execute operation
-            result = operation.execute(operand1, operand2)
-            
-            # Round to configured precision
-            result = round(result, config.precision)
-            
-            # Create calculation record
-            calculation = Calculation(
-                operation=operation.get_symbol(),
-                operand1=operand1,
-                operand2=operand2,
-                result=result
-            )
-            
-            # Add to history
-            self.history_manager.add_calculation(calculation)
-            
-            # Save state for undo/redo
-            self._save_state()
-            
-            # Notify observers
-            self._notify_observers(calculation)
-            
-            return result
-            
-        except Exception as e:
-            self.logger.error(f"Calculation failed: {e}")
+            # Execute operation and round to configured precision. Zero
+            # operands skip the cache: -0.0 and 0.0 are equal keys there but
+            # can give results of different sign
+            if operation.is_pure and operand1 and operand2:
+                result = _compute(operation, operand1, operand2, self._precision)
+            else:
+                result = round(operation.execute(operand1, operand2), self._precision)
+        except (CalculatorError, ValueError, ArithmeticError) as e:
+            self.logger.error("Calculation failed: %s", e)
             raise
+        
+        # Hot path: build the one Calculation record (timestamp defaults to
+        # epoch microseconds) and keep it as an object all the way into the
+        # history deque; to_dict() is only called when history is written out
+        calculation = Calculation(symbol, operand1, operand2, result)
+        
+        # Add to history
+        evicted = self.history_manager.add_calculation(calculation)
+        if evicted is not None:
+            self._auto_save_observer.request_rewrite()
+        
+        # Save state for undo/redo
+        self._save_state(CalculatorMemento.ADD, (calculation, evicted))
+        
+        # Notify observers
+        self._notify_observers(calculation)
+        
+        return result
+    
+    def calculate_many(self, calculations: Iterable[Tuple[str, float, float]]) -> List[float]:
+        """
+        Perform several calculations in order.
+        
+        Each calculation is recorded exactly as by calculate(): its own
+        history entry, undo step and observer notification.
+        
+        Args:
+            calculations: (operation name, operand1, operand2) tuples
+        
+        Returns:
+            Results in the same order
+        
+        Raises:
+            CalculatorError: If a calculation fails; the ones before it
+                stay in history
+        """
+        calculate = self.calculate
+        return [calculate(name, operand1, operand2) for name, operand1, operand2 in calculations]
+    
+    def calculate_batch(self, operation_name: str, operands1: Any, operands2: Any):
+        """
+        Perform one operation element-wise over arrays of operands.
+        
+        The loop runs inside NumPy instead of once per calculation through
+        calculate(), which makes scripted bulk work much faster. Batch
+        results are not added to history and do not notify observers.
+        
+        Args:
+            operation_name: Name of the operation
+            operands1: First operands (array-like or scalar)
+            operands2: Second operands (array-like or scalar, broadcast
+                against operands1)
+        
+        Returns:
+            NumPy array of results rounded to the configured precision
+        
+        Raises:
+            OperationError: If the operation is unknown or fails
+            DivisionByZeroError: If any second operand is zero for an
+                operation that does not allow it
+            ValidationError: If the operands are not numeric or their
+                shapes do not broadcast
+        """
+        import numpy as np
+        
+        name = operation_name.lower()
+        function = _batch_functions().get(name)
+        if function is None:
+            raise OperationError(f"Unknown operation: {operation_name}")
+        
+        try:
+            a = np.asarray(operands1, dtype=float)
+            b = np.asarray(operands2, dtype=float)
+            np.broadcast_shapes(a.shape, b.shape)
+        except (TypeError, ValueError) as e:
+            raise ValidationError(f"Invalid batch operands: {e}")
+        
+        if name in _ZERO_DIVISOR_ERRORS and np.any(b == 0):
+            raise DivisionByZeroError(_ZERO_DIVISOR_ERRORS[name])
+        
+        try:
+            # Overflow and invalid results raise, as they do for scalars
+            with np.errstate(over='raise', invalid='raise'):
+                result = function(a, b)
+        except FloatingPointError as e:
+            self.logger.error("Batch calculation failed: %s", e)
+            raise OperationError(f"{name.capitalize()} operation failed: {e}")
+        return np.round(result, self._precision)
     
     def undo(self) -> bool:
         """
@@ -149,7 +357,8 @@ class Calculator:
         
         memento = self.memento_caretaker.undo()
         if memento:
-            self.history_manager._history = memento.get_state()
+            self._revert(memento)
+            self._auto_save_observer.request_rewrite()
             self.logger.info("Undo performed")
             return True
         return False
@@ -167,7 +376,8 @@ class Calculator:
         
         memento = self.memento_caretaker.redo()
         if memento:
-            self.history_manager._history = memento.get_state()
+            self._reapply(memento)
+            self._auto_save_observer.request_rewrite()
             self.logger.info("Redo performed")
             return True
         return False
@@ -176,18 +386,37 @@ class Calculator:
         """Get calculation history."""
         return self.history_manager.get_history()
     
+    def get_history_count(self) -> int:
+        """Get the number of calculations in history without copying it."""
+        return len(self.history_manager)
+    
     def clear_history(self):
         """Clear calculation history."""
-        self.history_manager.clear_history()
-        self._save_state()
+        cleared = self.history_manager.clear_history()
+        self._auto_save_observer.request_rewrite()
+        self._save_state(CalculatorMemento.CLEAR, cleared)
     
-    def save_history(self, filepath: Optional[str] = None):
-        """Save history to file."""
-        path = None if filepath is None else Path(filepath)
+    def save_history(self, filepath: Union[str, TextIO, None] = None):
+        """Save history to file, or as CSV to an open text stream."""
+        path = filepath if filepath is None or hasattr(filepath, 'write') else Path(filepath)
+        # Write the pending auto-save batch first: appended after a full save
+        # of the auto-save file, those rows would end up in it twice
+        self.flush_auto_save()
         self.history_manager.save_to_csv(path)
     
+    def flush_auto_save(self):
+        """Write any auto-save batch that is still pending."""
+        self._auto_save_observer.flush()
+    
     def load_history(self, filepath: Optional[str] = None):
         """Load history from file."""
         path = None if filepath is None else Path(filepath)
+        # The history manager replaces its list on load, so the previous one
+        # can be kept for undo without copying it
+        before = self.history_manager.get_history(copy=False)
         self.history_manager.load_from_csv(path)
-        self._save_state()
\ No newline at end of file
+        self._auto_save_observer.request_rewrite()
+        # Keep the loaded list too, so redo restores it without reading the
+        # file again (which may have changed or gone by then)
+        loaded = self.history_manager.get_history(copy=False)
+        self._save_state(CalculatorMemento.CHECKPOINT, (before, loaded))
\ No newline at end of file
@@ -4,15 +4,22 @@ Configuration management for the calculator application.
 
 import os
 from pathlib import Path
-from dotenv import load_dotenv
+from typing import Any, Optional
 from app.exceptions import ConfigurationError
 
 class CalculatorConfig:
     """Manages calculator configuration settings."""
     
+    # Supported history file formats; feather and parquet require pyarrow
+    HISTORY_FORMATS = ('csv', 'feather', 'parquet')
+    
     def __init__(self):
         """Initialize configuration by loading environment variables."""
-        load_dotenv()
+        # Only parse .env once per process tree; child processes inherit the result
+        if os.getenv('CALCULATOR_ENV_LOADED') != '1':
+            from dotenv import load_dotenv
+            load_dotenv()
+            os.environ['CALCULATOR_ENV_LOADED'] = '1'
         self.load_configuration()
         self.validate()  # Call validate after loading
     
@@ -29,6 +36,9 @@ class CalculatorConfig:
         # History Settings - FIXED DEFAULT FROM 1000 to 100
         self.max_history_size = self._safe_int_getenv('CALCULATOR_MAX_HISTORY_SIZE', 100)
         self.auto_save = os.getenv('CALCULATOR_AUTO_SAVE', 'true').lower() == 'true'
+        self.autosave_batch_size = self._safe_int_getenv('CALCULATOR_AUTOSAVE_BATCH_SIZE', 32)
+        self.max_undo_depth = self._safe_int_getenv('CALCULATOR_MAX_UNDO_DEPTH', 100)
+        self.history_format = os.getenv('CALCULATOR_HISTORY_FORMAT', 'csv').lower()
         
         # Calculation Settings
         self.precision = self._safe_int_getenv('CALCULATOR_PRECISION', 10)
@@ -37,7 +47,7 @@ class CalculatorConfig:
         
         # File paths
         self.log_file = self.log_dir / 'calculator.log'
-        self.history_file = self.history_dir / 'history.csv'
+        self.history_file = self.history_dir / f'history.{self.history_format}'
     
     def _safe_int_getenv(self, key: str, default: int) -> int:
         """Safely get integer from environment variable."""
@@ -64,6 +74,17 @@ class CalculatorConfig:
         if self.max_history_size < 1:
             raise ConfigurationError("CALCULATOR_MAX_HISTORY_SIZE must be at least 1")
         
+        if self.autosave_batch_size < 1:
+            raise ConfigurationError("CALCULATOR_AUTOSAVE_BATCH_SIZE must be at least 1")
+        
+        if self.max_undo_depth < 2:
+            raise ConfigurationError("CALCULATOR_MAX_UNDO_DEPTH must be at least 2")
+        
+        if self.history_format not in self.HISTORY_FORMATS:
+            raise ConfigurationError(
+                f"CALCULATOR_HISTORY_FORMAT must be one of: {', '.join(self.HISTORY_FORMATS)}"
+            )
+        
         if self.precision < 0:
             raise ConfigurationError("CALCULATOR_PRECISION must be non-negative")
         
@@ -78,5 +99,25 @@ class CalculatorConfig:
         """Get the history file path."""
         return self.history_file
 
-# Global configuration instance
-config = CalculatorConfig()
\ No newline at end of file
+_config: Optional[CalculatorConfig] = None
+
+def get_config() -> CalculatorConfig:
+    """Get the global configuration, creating it on first use."""
+    global _config
+    if _config is None:
+        _config = CalculatorConfig()
+    return _config
+
+class _ConfigProxy:
+    """Stand-in for the global configuration that defers loading until first use."""
+    
+    def __getattr__(self, name: str) -> Any:
+        """Read a setting from the global configuration."""
+        return getattr(get_config(), name)
+    
+    def __setattr__(self, name: str, value: Any):
+        """Override a setting on the global configuration."""
+        setattr(get_config(), name, value)
+
+# Global configuration instance (loaded lazily on first attribute access)
+config = _ConfigProxy()
\ No newline at end of file
@@ -2,44 +2,72 @@
 Memento pattern implementation for undo/redo functionality.
 """
 
-from typing import List, Optional
-from app.calculation import Calculation
+from collections import deque
+from typing import Any, Deque, Literal, Optional
+from app.calculator_config import config
+
+MementoOp = Literal['add', 'clear', 'checkpoint']
 
 class CalculatorMemento:
-    """Memento class to store calculator state."""
+    """Memento class storing a single change to the calculator history."""
+    
+    ADD: MementoOp = 'add'
+    CLEAR: MementoOp = 'clear'
+    CHECKPOINT: MementoOp = 'checkpoint'
     
-    def __init__(self, state: List[Calculation]):
-        """Initialize memento with a state."""
-        self._state = state.copy()
+    def __init__(self, op: MementoOp, payload: Any = None):
+        """
+        Initialize memento with a history change.
+        
+        Args:
+            op: Kind of change ('add', 'clear' or 'checkpoint')
+            payload: Data needed to revert and reapply the change:
+                'add' -> (calculation, evicted calculation or None),
+                'clear' -> list of cleared calculations,
+                'checkpoint' -> (history before, history loaded), or
+                None for the initial state
+        """
+        self.op = op
+        self._payload = payload
     
-    def get_state(self) -> List[Calculation]:
-        """Get the stored state."""
-        return self._state.copy()
+    def get_state(self) -> Any:
+        """Get the stored change payload."""
+        return self._payload
 
 class MementoCaretaker:
     """Manages memento objects for undo/redo functionality."""
     
-    def __init__(self):
-        """Initialize the caretaker."""
-        self._mementos: List[CalculatorMemento] = []
+    def __init__(self, max_depth: Optional[int] = None):
+        """
+        Initialize the caretaker.
+        
+        Args:
+            max_depth: Maximum number of mementos kept (defaults to config)
+        """
+        if max_depth is None:
+            max_depth = config.max_undo_depth
+        self._mementos: Deque[CalculatorMemento] = deque(maxlen=max_depth)
         self._current_index: int = -1
     
     def save(self, memento: CalculatorMemento):
-        """Save a new memento."""
+        """Save a new memento, dropping the oldest once the cap is reached."""
         # Remove any mementos after current index (for new branch after undo)
-        self._mementos = self._mementos[:self._current_index + 1]
+        while len(self._mementos) > self._current_index + 1:
+            self._mementos.pop()
         self._mementos.append(memento)
+        # The deque evicts from the left when full, so the index stays clamped
         self._current_index = len(self._mementos) - 1
     
     def undo(self) -> Optional[CalculatorMemento]:
-        """Get the previous memento."""
+        """Get the memento of the change to revert."""
         if self._current_index > 0:
+            memento = self._mementos[self._current_index]
             self._current_index -= 1
-            return self._mementos[self._current_index]
+            return memento
         return None
     
     def redo(self) -> Optional[CalculatorMemento]:
-        """Get the next memento."""
+        """Get the memento of the change to reapply."""
         if self._current_index < len(self._mementos) - 1:
             self._current_index += 1
             return self._mementos[self._current_index]
@@ -1,10 +1,51 @@
 """
 REPL (Read-Eval-Print Loop) interface for the calculator
 """
-from typing import Tuple, List
+import sys
+from pathlib import Path
+from types import MappingProxyType
+from typing import Iterable, List, Tuple
 from app.calculator import Calculator
+from app.operations import OperationFactory
 from app.exceptions import CalculatorError, OperationError, ValidationError, HistoryError
 
+# Commands handled by _handle_operation
+_ARITH_SET = frozenset(OperationFactory.get_available_operations())
+
+# Help screen, written in one go by _handle_help
+_HELP_TEXT = """
+============================================================
+AVAILABLE COMMANDS
+============================================================
+
+Arithmetic Operations:
+  add <a> <b>         - Add two numbers
+  subtract <a> <b>    - Subtract b from a
+  multiply <a> <b>    - Multiply two numbers
+  divide <a> <b>      - Divide a by b
+  power <a> <b>       - Raise a to the power of b
+  modulus <a> <b>     - Calculate a modulo b
+  root <a> <b>        - Calculate bth root of a
+  int_divide <a> <b>  - Integer division of a by b
+  percent <a> <b>     - Calculate a as percentage of b
+  abs_diff <a> <b>    - Absolute difference between a and b
+
+History Commands:
+  history             - Display calculation history
+  clear               - Clear calculation history
+  undo                - Undo last calculation
+  redo                - Redo last undone calculation
+
+File Operations:
+  save [filename]     - Save history to file (default: history.csv)
+  load [filename]     - Load history from file (default: history.csv)
+
+Other Commands:
+  help                - Display this help message
+  exit                - Exit the calculator
+============================================================
+"""
+
 
 class REPL:
     """Command-line interface for the calculator"""
@@ -18,50 +59,85 @@ class REPL:
         """
         self.calculator = calculator
         self.running = False
-        self.commands = {
-            'add': self._handle_operation,
-            'subtract': self._handle_operation,
-            'multiply': self._handle_operation,
-            'divide': self._handle_operation,
-            'power': self._handle_operation,
-            'modulus': self._handle_operation,
-            'root': self._handle_operation,
-            'int_divide': self._handle_operation,
-            'percent': self._handle_operation,
-            'abs_diff': self._handle_operation,
-            'history': self._handle_history,
-            'clear': self._handle_clear,
-            'undo': self._handle_undo,
-            'redo': self._handle_redo,
-            'save': self._handle_save,
-            'load': self._handle_load,
-            'help': self._handle_help,
-            'exit': self._handle_exit,
-        }
+    
+    def _out(self, text: str):
+        """Write text to the current stdout (outside a start() session)."""
+        sys.stdout.write(text)
     
     def start(self):
         """Start the REPL"""
         self.running = True
-        self._print_welcome()
+        # Output goes straight to stdout's write; input() flushes it before
+        # each prompt, so there is no per-line flush as with print(). Bound
+        # once here so the session loop skips the sys.stdout lookup; removed
+        # afterwards so the _out method writes to the current stdout again
+        self._out = sys.stdout.write
+        try:
+            self._print_welcome()
+            
+            stdin = sys.stdin
+            if stdin.isatty():
+                self._run_interactive()
+            else:
+                # Scripted input: iterate the stream directly instead of
+                # calling input(), which flushes the streams and writes the
+                # prompt on every line
+                self._run_lines(stdin)
+            
+            sys.stdout.flush()
+        finally:
+            del self._out
+    
+    def _run_interactive(self):
+        """Read commands from the terminal with input() until exit or EOF."""
+        # Bind names used on every iteration to locals for faster lookup
+        read_input = input
+        process_input = self._process_input
+        out = self._out
         
         while self.running:
             try:
-                user_input = input("\n> ").strip()
+                user_input = read_input("\n> ").strip()
                 
                 if not user_input:
                     continue
                 
-                self._process_input(user_input)
+                process_input(user_input)
                 
             except KeyboardInterrupt:
-                print("\n\nUse 'exit' to quit the calculator.")
+                out("\n\nUse 'exit' to quit the calculator.\n")
             except EOFError:
                 break
     
+    def _run_lines(self, lines: Iterable[str]):
+        """
+        Process commands from an iterable of lines until exit or the end.
+        
+        The prompt is still written before each line so scripted sessions
+        produce the same output as interactive ones.
+        """
+        process_input = self._process_input
+        out = self._out
+        next_line = iter(lines).__next__
+        
+        while self.running:
+            # Reading is inside the try too, so Ctrl-C while blocked on
+            # piped input is handled as in interactive mode
+            try:
+                line = next_line()
+                out("\n> ")
+                user_input = line.strip()
+                if user_input:
+                    process_input(user_input)
+            except StopIteration:
+                break
+            except KeyboardInterrupt:
+                out("\n\nUse 'exit' to quit the calculator.\n")
+    
     def _print_welcome(self):
         """Print welcome message"""
-        print("\nWelcome to Chinedu's Brand New Advanced Calculator!")
-        print("Type 'help' for available commands or 'exit' to quit.\n")
+        self._out("\nWelcome to Chinedu's Brand New Advanced Calculator!\n")
+        self._out("Type 'help' for available commands or 'exit' to quit.\n\n")
     
     def _process_input(self, user_input: str):
         """
@@ -70,12 +146,21 @@ class REPL:
         Args:
             user_input: User's input string
         """
+        # Fast path for arithmetic: split off the command word without
+        # building the full token list or going through the commands table
+        head, _, tail = user_input.strip().partition(' ')
+        command = head.lower()
+        if command in _ARITH_SET:
+            self._handle_operation(command, tail.split())
+            return
+        
         command, args = self.parse_command(user_input)
         
-        if command in self.commands:
-            self.commands[command](command, args)
+        handler = self.commands.get(command)
+        if handler is not None:
+            handler(self, command, args)
         else:
-            print(f"Error: Unknown command '{command}'. Type 'help' for available commands.")
+            self._out(f"Error: Unknown command '{command}'. Type 'help' for available commands.\n")
     
     def parse_command(self, user_input: str) -> Tuple[str, List[str]]:
         """
@@ -101,135 +186,122 @@ class REPL:
             args: List of operands
         """
         if len(args) != 2:
-            print(f"Error: '{command}' requires exactly 2 operands.")
-            print(f"Usage: {command} <number1> <number2>")
+            self._out(f"Error: '{command}' requires exactly 2 operands.\n")
+            self._out(f"Usage: {command} <number1> <number2>\n")
             return
         
         try:
-            operand1 = float(args[0])
-            operand2 = float(args[1])
+            operand1, operand2 = map(float, args)
             
             result = self.calculator.calculate(command, operand1, operand2)
-            print(f"Result: {result}")
+            self._out(f"Result: {result}\n")
             
         except ValueError:
-            print("Error: Invalid number format. Please enter valid numbers.")
+            self._out("Error: Invalid number format. Please enter valid numbers.\n")
         except OperationError as e:
-            print(f"Operation Error: {e}")
+            self._out(f"Operation Error: {e}\n")
         except ValidationError as e:
-            print(f"Validation Error: {e}")
+            self._out(f"Validation Error: {e}\n")
         except CalculatorError as e:
-            print(f"Calculator Error: {e}")
+            self._out(f"Calculator Error: {e}\n")
     
     def _handle_history(self, command: str, args: List[str]):
         """Display calculation history"""
         history = self.calculator.get_history()
         
         if not history:
-            print("History is empty.")
+            self._out("History is empty.\n")
             return
         
-        print("\n" + "=" * 60)
-        print("CALCULATION HISTORY")
-        print("=" * 60)
-        
+        lines = ["", "=" * 60, "CALCULATION HISTORY", "=" * 60]
         for i, calc in enumerate(history, 1):
-            op_name = calc.operation.name
-            op_symbol = calc.operation.symbol
-            result = calc.result
-            
-            print(f"{i}. {calc.operand1} {op_symbol} {calc.operand2} = {result} ({op_name})")
+            # History stores the operation symbol; older files may hold the name
+            op_name, op_symbol = OperationFactory.describe(calc.operation)
+            lines.append(f"{i}. {calc.operand1} {op_symbol} {calc.operand2} = {calc.result} ({op_name})")
+        lines.append("=" * 60)
         
-        print("=" * 60)
+        self._out("\n".join(lines) + "\n")
     
     def _handle_clear(self, command: str, args: List[str]):
         """Clear calculation history"""
         self.calculator.clear_history()
-        print("History cleared successfully.")
+        self._out("History cleared successfully.\n")
     
     def _handle_undo(self, command: str, args: List[str]):
         """Undo last calculation"""
         try:
             self.calculator.undo()
-            print("Undid last calculation.")
+            self._out("Undid last calculation.\n")
         except HistoryError as e:
-            print(f"Error: {e}")
+            self._out(f"Error: {e}\n")
     
     def _handle_redo(self, command: str, args: List[str]):
         """Redo last undone calculation"""
         try:
             self.calculator.redo()
-            print("Redid last calculation.")
+            self._out("Redid last calculation.\n")
         except HistoryError as e:
-            print(f"Error: {e}")
+            self._out(f"Error: {e}\n")
     
     def _handle_save(self, command: str, args: List[str]):
         """Save calculation history to file"""
         try:
-            from pathlib import Path
-            
             filename = args[0] if args else "history.csv"
             filepath = Path(filename)
             
             self.calculator.save_history(filepath)
-            print(f"History saved to {filepath}")
+            self._out(f"History saved to {filepath}\n")
             
         except Exception as e:
-            print(f"Error saving history: {e}")
+            self._out(f"Error saving history: {e}\n")
     
     def _handle_load(self, command: str, args: List[str]):
         """Load calculation history from file"""
         try:
-            from pathlib import Path
-            
             filename = args[0] if args else "history.csv"
             filepath = Path(filename)
             
             self.calculator.load_history(filepath)
-            print(f"History loaded from {filepath}")
+            self._out(f"History loaded from {filepath}\n")
             
         except FileNotFoundError:
-            print(f"Error: File '{filename}' not found.")
+            self._out(f"Error: File '{filename}' not found.\n")
         except Exception as e:
-            print(f"Error loading history: {e}")
+            self._out(f"Error loading history: {e}\n")
     
     def _handle_help(self, command: str, args: List[str]):
         """Display help information"""
-        print("\n" + "=" * 60)
-        print("AVAILABLE COMMANDS")
-        print("=" * 60)
-        print("\nArithmetic Operations:")
-        print("  add <a> <b>         - Add two numbers")
-        print("  subtract <a> <b>    - Subtract b from a")
-        print("  multiply <a> <b>    - Multiply two numbers")
-        print("  divide <a> <b>      - Divide a by b")
-        print("  power <a> <b>       - Raise a to the power of b")
-        print("  modulus <a> <b>     - Calculate a modulo b")
-        print("  root <a> <b>        - Calculate bth root of a")
-        print("  int_divide <a> <b>  - Integer division of a by b")
-        print("  percent <a> <b>     - Calculate a as percentage of b")
-        print("  abs_diff <a> <b>    - Absolute difference between a and b")
-        
-        print("\nHistory Commands:")
-        print("  history             - Display calculation history")
-        print("  clear               - Clear calculation history")
-        print("  undo                - Undo last calculation")
-        print("  redo                - Redo last undone calculation")
-        
-        print("\nFile Operations:")
-        print("  save [filename]     - Save history to file (default: history.csv)")
-        print("  load [filename]     - Load history from file (default: history.csv)")
-        
-        print("\nOther Commands:")
-        print("  help                - Display this help message")
-        print("  exit                - Exit the calculator")
-        print("=" * 60)
+        self._out(_HELP_TEXT)
     
     def _handle_exit(self, command: str, args: List[str]):
         """Exit the calculator"""
-        print("\nThank you for using the Advanced Calculator. Goodbye!")
+        self.calculator.flush_auto_save()
+        self._out("\nThank you for using the Advanced Calculator. Goodbye!\n")
         self.running = False
     
     def get_logger(self):
         """Get logger instance (for testing)"""
-        return getattr(self, 'logger', None)
\ No newline at end of file
+        return getattr(self, 'logger', None)
+    
+    # Command table built once for the class and shared by every REPL;
+    # handlers are plain functions, called with the REPL as first argument
+    commands = MappingProxyType({
+        'add': _handle_operation,
+        'subtract': _handle_operation,
+        'multiply': _handle_operation,
+        'divide': _handle_operation,
+        'power': _handle_operation,
+        'modulus': _handle_operation,
+        'root': _handle_operation,
+        'int_divide': _handle_operation,
+        'percent': _handle_operation,
+        'abs_diff': _handle_operation,
+        'history': _handle_history,
+        'clear': _handle_clear,
+        'undo': _handle_undo,
+        'redo': _handle_redo,
+        'save': _handle_save,
+        'load': _handle_load,
+        'help': _handle_help,
+        'exit': _handle_exit,
+    })
\ No newline at end of file
@@ -2,46 +2,113 @@
 History management for the calculator application.
 """
 
-import pandas as pd
+import csv
+from collections import deque
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Optional
+from typing import Deque, Iterable, List, Optional, Sequence, TextIO, Union
 from datetime import datetime
 from app.calculation import Calculation
 from app.calculator_config import config
-from app.exceptions import HistoryError, FileOperationError
+from app.exceptions import HistoryError, FileOperationError, ValidationError
 from app.logger import Logger
 
+# Column order of history files
+_FIELDNAMES = ['operation', 'operand1', 'operand2', 'result', 'timestamp']
+
+# File suffixes that are read and written with pandas instead of csv
+_BINARY_SUFFIXES = ('.feather', '.parquet')
+
 class HistoryManager:
     """Manages calculation history with persistence."""
     
     def __init__(self):
         """Initialize the history manager."""
-        self._history: List[Calculation] = []
+        # Bounded deque: appending past the maximum size drops the oldest
+        # calculation in O(1) instead of shifting a list with pop(0)
+        self._history: Deque[Calculation] = deque(maxlen=config.max_history_size)
         self.logger = Logger()
     
-    def add_calculation(self, calculation: Calculation):
-        """Add a calculation to history."""
-        self._history.append(calculation)
+    def add_calculation(self, calculation: Calculation) -> Optional[Calculation]:
+        """
+        Add a calculation to history.
+        
+        Returns:
+            The oldest calculation if it was evicted to respect the
+            maximum history size, otherwise None
         
-        # Enforce maximum history size
-        if len(self._history) > config.max_history_size:
-            self._history.pop(0)
+        Raises:
+            ValidationError: If calculation is None
+        """
+        if calculation is None:
+            raise ValidationError("Cannot add None to history")
+        history = self._history
+        evicted = None
+        if len(history) == history.maxlen:
+            # The deque is full, so append drops the oldest entry
+            evicted = history[0] if history else calculation
+        history.append(calculation)
+        return evicted
+    
+    def get_history(self, copy: bool = True) -> Sequence[Calculation]:
+        """
+        Get all calculations in history.
+        
+        Args:
+            copy: Return a list copy; pass False to get the live deque,
+                which callers must treat as read-only
+        """
+        return list(self._history) if copy else self._history
+    
+    def restore_to_length(self, length: int):
+        """Truncate history to its first ``length`` calculations in place."""
+        history = self._history
+        while len(history) > length:
+            history.pop()
+    
+    def append_calculations(self, calculations: Iterable[Calculation]):
+        """Append calculations in bulk, e.g. to restore a cleared history."""
+        self._history.extend(calculations)
+    
+    def prepend_calculation(self, calculation: Calculation):
+        """Put a previously evicted calculation back at the oldest position."""
+        self._history.appendleft(calculation)
     
-    def get_history(self) -> List[Calculation]:
-        """Get all calculations in history."""
-        return self._history.copy()
+    def set_history(self, calculations: Iterable[Calculation]):
+        """
+        Replace the history with the given calculations.
+        
+        A deque with the configured maximum length is taken over as is;
+        anything else is copied into a new bounded deque.
+        """
+        maxlen = self._history.maxlen
+        if not isinstance(calculations, deque) or calculations.maxlen != maxlen:
+            calculations = deque(calculations, maxlen=maxlen)
+        self._history = calculations
     
-    def clear_history(self):
-        """Clear all history."""
-        self._history.clear()
+    def clear_history(self) -> Deque[Calculation]:
+        """
+        Clear all history.
+        
+        Returns:
+            The calculations that were cleared (handed over, not copied)
+        """
+        cleared = self._history
+        self._history = deque(maxlen=cleared.maxlen)
         self.logger.info("History cleared")
+        return cleared
     
-    def save_to_csv(self, filepath: Optional[Path] = None):
+    def save_to_csv(self, filepath: Union[Path, TextIO, None] = None):
         """
-        Save history to CSV file using pandas.
+        Save history to file.
+        
+        CSV files are written with the csv module; '.feather' and '.parquet'
+        files are written with pandas and pyarrow.
         
         Args:
-            filepath: Optional custom filepath
+            filepath: Optional custom filepath, or an open text stream
+                (anything with a write method) to write CSV to
         """
         filepath = filepath or config.history_file
         
@@ -50,60 +117,157 @@ class HistoryManager:
                 self.logger.warning("No history to save")
                 return
             
-            # Convert calculations to dictionaries
-            data = [calc.to_dict() for calc in self._history]
-            
-            # Create DataFrame
-            df = pd.DataFrame(data)
-            
-            # Save to CSV
-            df.to_csv(filepath, index=False, encoding=config.default_encoding)
-            
-            self.logger.info(f"History saved to {filepath}")
+            if hasattr(filepath, 'write'):
+                self._write_csv(filepath)
+            elif filepath.suffix.lower() in _BINARY_SUFFIXES:
+                self._save_with_pandas(filepath, filepath.suffix.lower())
+            else:
+                with open(filepath, 'w', newline='', encoding=config.default_encoding) as f:
+                    self._write_csv(f)
             
+            self.logger.info("History saved to %s", filepath)
+        
         except Exception as e:
             error_msg = f"Failed to save history: {e}"
             self.logger.error(error_msg)
             raise FileOperationError(error_msg)
     
-    def load_from_csv(self, filepath: Optional[Path] = None):
+    def _write_csv(self, stream: TextIO):
+        """Write the header and every calculation as CSV to a text stream."""
+        writer = csv.DictWriter(stream, fieldnames=_FIELDNAMES)
+        writer.writeheader()
+        writer.writerows(calc.to_dict() for calc in self._history)
+    
+    def _save_with_pandas(self, filepath: Path, suffix: str):
+        """Write history to a feather or parquet file."""
+        # Imported lazily; only the binary formats need pandas
+        import pandas as pd
+        
+        # Build the DataFrame column by column so pandas gets typed
+        # columns directly instead of inferring them from per-row dicts
+        history = self._history
+        df = pd.DataFrame({
+            'operation': [calc.operation for calc in history],
+            'operand1': [calc.operand1 for calc in history],
+            'operand2': [calc.operand2 for calc in history],
+            'result': [calc.result for calc in history],
+            'timestamp': [calc.timestamp for calc in history],
+        })
+        
+        if suffix == '.feather':
+            df.to_feather(filepath)
+        else:
+            df.to_parquet(filepath, index=False)
+    
+    def can_append(self, filepath: Optional[Path] = None) -> bool:
+        """Check whether the history file supports appending rows (CSV only)."""
+        filepath = filepath or config.history_file
+        return filepath.suffix.lower() not in _BINARY_SUFFIXES
+    
+    def append_to_csv(self, calculations: List[Calculation],
+                      filepath: Optional[Path] = None):
         """
-        Load history from CSV file using pandas.
+        Append calculations to the CSV file without rewriting it.
         
         Args:
+            calculations: Calculations to append, oldest first
             filepath: Optional custom filepath
         """
         filepath = filepath or config.history_file
         
         try:
-            if not filepath.exists():
-                self.logger.warning(f"History file not found: {filepath}")
+            if not calculations:
                 return
             
-            # Read CSV
-            df = pd.read_csv(filepath, encoding=config.default_encoding)
+            rows = [calc.to_dict() for calc in calculations]
+            write_header = not filepath.exists() or filepath.stat().st_size == 0
             
-            # Clear current history
-            self._history.clear()
+            with open(filepath, 'a', newline='', encoding=config.default_encoding) as f:
+                writer = csv.DictWriter(f, fieldnames=_FIELDNAMES)
+                if write_header:
+                    writer.writeheader()
+                writer.writerows(rows)
+                f.flush()
             
-            # Convert DataFrame rows to Calculation objects
-            for _, row in df.iterrows():
-                calc_dict = row.to_dict()
-                calculation = Calculation.from_dict(calc_dict)
-                self._history.append(calculation)
+            self.logger.debug("Appended %d calculations to %s", len(rows), filepath)
+        
+        except Exception as e:
+            error_msg = f"Failed to append history: {e}"
+            self.logger.error(error_msg)
+            raise FileOperationError(error_msg)
+    
+    def load_from_csv(self, filepath: Union[Path, TextIO, None] = None):
+        """
+        Load history from file.
+        
+        The format follows the file suffix, as in save_to_csv.
+        
+        Args:
+            filepath: Optional custom filepath, or an open text stream
+                (anything with a read method) to read CSV from
+        """
+        filepath = filepath or config.history_file
+        
+        try:
+            if hasattr(filepath, 'read'):
+                loaded = self._read_csv(filepath)
+            elif not filepath.exists():
+                self.logger.warning("History file not found: %s", filepath)
+                return
+            elif filepath.suffix.lower() in _BINARY_SUFFIXES:
+                rows = self._read_with_pandas(filepath, filepath.suffix.lower())
+                loaded = [Calculation.from_dict(row) for row in rows]
+            else:
+                with open(filepath, newline='', encoding=config.default_encoding) as f:
+                    loaded = self._read_csv(f)
             
-            self.logger.info(f"Loaded {len(self._history)} calculations from {filepath}")
+            if loaded is None:
+                self.logger.warning("History file is empty")
+                return
+            
+            # Replace the current history rather than clearing it in place;
+            # only the newest max_history_size calculations are kept
+            self._history = deque(loaded, maxlen=self._history.maxlen)
             
-        except pd.errors.EmptyDataError:
-            self.logger.warning("History file is empty")
+            self.logger.info("Loaded %d calculations from %s", len(self._history), filepath)
+        
         except Exception as e:
             error_msg = f"Failed to load history: {e}"
             self.logger.error(error_msg)
             raise FileOperationError(error_msg)
     
+    def _read_csv(self, stream: TextIO) -> Optional[List[Calculation]]:
+        """Read calculations from CSV text; None if there is not even a header."""
+        reader = csv.reader(stream)
+        header = next(reader, None)
+        if header is None:
+            return None
+        # Rows are plain lists; pick the columns by header position and
+        # build each Calculation positionally, skipping blank lines
+        columns = itemgetter(*(header.index(name) for name in _FIELDNAMES))
+        parse_timestamp = Calculation.parse_timestamp
+        return [
+            Calculation(operation, float(operand1), float(operand2),
+                        float(result), parse_timestamp(timestamp))
+            for operation, operand1, operand2, result, timestamp
+            in map(columns, filter(None, reader))
+        ]
+    
+    def _read_with_pandas(self, filepath: Path, suffix: str) -> List[dict]:
+        """Read history rows from a feather or parquet file."""
+        # Imported lazily; only the binary formats need pandas
+        import pandas as pd
+        
+        if suffix == '.feather':
+            df = pd.read_feather(filepath)
+        else:
+            df = pd.read_parquet(filepath)
+        return df.to_dict('records')
+    
     def get_recent(self, count: int = 10) -> List[Calculation]:
         """Get the most recent calculations."""
-        return self._history[-count:] if self._history else []
+        history = self._history
+        return list(islice(history, max(0, len(history) - count), None))
     
     def __len__(self) -> int:
         """Get the number of calculations in history."""
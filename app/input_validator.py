@@ -2,13 +2,38 @@
 Input validation utilities for the calculator application.
 """
 
+import re
 from typing import Tuple, Optional
 from app.calculator_config import config
 from app.exceptions import ValidationError
+from app.operations import OperationFactory
+
+# Operation names for O(1) membership tests on every input line
+_VALID_OPERATIONS = frozenset(OperationFactory.get_available_operations())
+
+# Plain decimal or scientific notation, which covers nearly all real input
+_NUMBER_RE = re.compile(r'-?\d+(?:\.\d*)?(?:[eE][+-]?\d+)?')
+
+# Cached config.max_input_value; filled on first use and by InputValidator.reload()
+_MAX_INPUT: Optional[float] = None
 
 class InputValidator:
     """Validates user inputs for the calculator."""
     
+    @staticmethod
+    def reload() -> float:
+        """
+        Re-read cached settings from the configuration.
+        
+        Call this after changing config.max_input_value at runtime.
+        
+        Returns:
+            The maximum allowed input value now in effect
+        """
+        global _MAX_INPUT
+        _MAX_INPUT = config.max_input_value
+        return _MAX_INPUT
+    
     @staticmethod
     def validate_number(value: str, param_name: str = "value") -> float:
         """
@@ -24,15 +49,24 @@ class InputValidator:
         Raises:
             ValidationError: If validation fails
         """
-        try:
+        if isinstance(value, str) and _NUMBER_RE.fullmatch(value):
+            # Common case: float() cannot fail, so skip the try block
             num = float(value)
-        except ValueError:
-            raise ValidationError(f"{param_name} must be a number, got: {value}")
+        else:
+            # Other spellings float() accepts (".5", "+1", "inf", padding)
+            try:
+                num = float(value)
+            except ValueError:
+                raise ValidationError(f"{param_name} must be a number, got: {value}")
         
-        if abs(num) > config.max_input_value:
+        max_input = _MAX_INPUT
+        if max_input is None:
+            max_input = InputValidator.reload()
+        
+        if abs(num) > max_input:
             raise ValidationError(
                 f"{param_name} exceeds maximum allowed value "
-                f"({config.max_input_value})"
+                f"({max_input})"
             )
         
         return num
@@ -51,16 +85,14 @@ class InputValidator:
         Raises:
             ValidationError: If operation is invalid
         """
-        from .operations import OperationFactory
-        
-        valid_operations = OperationFactory.get_available_operations()
-        if operation.lower() not in valid_operations:
+        name = operation.lower()
+        if name not in _VALID_OPERATIONS:
             raise ValidationError(
                 f"Invalid operation: {operation}. "
-                f"Valid operations: {', '.join(valid_operations)}"
+                f"Valid operations: {', '.join(OperationFactory.get_available_operations())}"
             )
         
-        return operation.lower()
+        return name
     
     @staticmethod
     def parse_calculation_input(user_input: str) -> Tuple[str, Optional[float], Optional[float]]:
@@ -84,10 +116,7 @@ class InputValidator:
         operation = parts[0].lower()
         
         # Check if it's a calculation operation
-        from app.operations import OperationFactory
-        valid_operations = OperationFactory.get_available_operations()
-        
-        if operation not in valid_operations:
+        if operation not in _VALID_OPERATIONS:
             return operation, None, None
         
         if len(parts) != 3:
@@ -2,72 +2,203 @@
 Logging configuration and Logger class for the calculator application.
 """
 
+import atexit
 import logging
+import os
+import queue
+import threading
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 from app.calculator_config import config
 
+# Shared by every handler; built once instead of on each initialization
+_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    File handler that leaves flushing to the OS page cache.
+    
+    logging.FileHandler flushes after every record; this one only flushes
+    for records at flush_level or above, and when the handler is closed.
+    """
+    
+    def __init__(self, *args, flush_level: int = logging.WARNING, **kwargs):
+        self.flush_level = flush_level
+        self._defer_flush = False
+        super().__init__(*args, **kwargs)
+    
+    def emit(self, record: logging.LogRecord):
+        """Write the record, flushing only if it is important enough."""
+        self._defer_flush = record.levelno < self.flush_level
+        try:
+            super().emit(record)
+        finally:
+            self._defer_flush = False
+    
+    def flush(self):
+        """Flush the stream unless called from emit for a low-level record."""
+        if not self._defer_flush:
+            super().flush()
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    Queue handler that leaves formatting to the listener thread.
+    
+    QueueHandler.prepare formats each record on the calling thread so it
+    can be pickled. This queue never leaves the process, so the record is
+    enqueued as is and the listener's handlers format it; arguments are
+    therefore rendered when the listener gets to them, not at the call.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Enqueue the record unformatted."""
+        return record
+
 class Logger:
     """Custom logger for the calculator application."""
     
     _instance: Optional['Logger'] = None
+    # Background thread that owns the real handlers
+    _listener: Optional[QueueListener] = None
+    # Guards first construction so two threads cannot both open the log file
+    _lock = threading.Lock()
+    # Open file handler per (log file, encoding), reused across reinitializations
+    _handler_cache: Dict[Tuple[str, str], BufferedFileHandler] = {}
     
     def __new__(cls):
         """Ensure only one logger instance exists (singleton)."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialize_logger()
-        return cls._instance
+        # Lock-free fast path once the singleton is built
+        instance = cls._instance
+        if instance is not None and getattr(instance, '_initialized', False):
+            return instance
+        with cls._lock:
+            # Re-check: another thread may have built it while we waited
+            instance = cls._instance
+            if instance is not None and getattr(instance, '_initialized', False):
+                return instance
+            if instance is None:
+                instance = cls._instance = super().__new__(cls)
+            instance._initialize_logger()
+            instance._initialized = True
+            return instance
     
     def _initialize_logger(self):
         """Initialize the logger with configuration."""
         self.logger = logging.getLogger('CalculatorApp')
         self.logger.setLevel(logging.DEBUG)
         
-        # Clear any existing handlers
+        # Stop and clear any handlers left by a previous instance, keeping
+        # the file handler open in case it can be reused below
+        Logger.shutdown(keep_files=True)
         self.logger.handlers = []
         
-        # Create file handler
-        file_handler = logging.FileHandler(
-            config.log_file,
-            encoding=config.default_encoding
-        )
-        file_handler.setLevel(logging.INFO)
+        # The test suite sets CALCULATOR_TEST_MODE: no log file, no listener
+        # thread; records still propagate, so pytest's caplog sees them
+        if os.environ.get('CALCULATOR_TEST_MODE') == '1':
+            self.logger.addHandler(logging.NullHandler())
+            return
+        
+        # Reuse the file handler when the target file is unchanged; otherwise
+        # close stale ones and create it (the file opens on the first write)
+        key = (str(config.log_file), config.default_encoding)
+        file_handler = Logger._handler_cache.get(key)
+        if file_handler is None:
+            Logger._close_cached_handlers()
+            file_handler = BufferedFileHandler(
+                config.log_file,
+                encoding=config.default_encoding,
+                delay=True
+            )
+            file_handler.setLevel(logging.INFO)
+            file_handler.setFormatter(_FORMATTER)
+            Logger._handler_cache[key] = file_handler
         
         # Create console handler
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.WARNING)
+        console_handler.setFormatter(_FORMATTER)
         
-        # Create formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
+        # Buffer file records so runs of INFO messages reach the disk in one
+        # write; a WARNING or worse, a full buffer or shutdown flushes them
+        buffered_file_handler = MemoryHandler(
+            capacity=512,
+            flushLevel=logging.WARNING,
+            target=file_handler,
+            flushOnClose=True
         )
+        buffered_file_handler.setLevel(logging.INFO)
         
-        # Add formatter to handlers
-        file_handler.setFormatter(formatter)
-        console_handler.setFormatter(formatter)
+        # The logger only enqueues records; a listener thread formats them and
+        # does the file and console I/O, so logging never blocks a calculation
+        # on a write. Records below every handler's level are dropped here
+        # rather than queued
+        log_queue = queue.SimpleQueue()
+        queue_handler = DeferredQueueHandler(log_queue)
+        queue_handler.setLevel(min(buffered_file_handler.level, console_handler.level))
+        self.logger.addHandler(queue_handler)
+        listener = QueueListener(
+            log_queue, buffered_file_handler, console_handler,
+            respect_handler_level=True
+        )
+        listener.start()
+        Logger._listener = listener
+    
+    @classmethod
+    def shutdown(cls, keep_files: bool = False):
+        """
+        Stop the listener thread, writing out queued records, and close handlers.
         
-        # Add handlers to logger
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+        Args:
+            keep_files: Flush the cached file handlers instead of closing them
+        """
+        listener = cls._listener
+        cls._listener = None
+        if listener is not None:
+            listener.stop()
+            for handler in listener.handlers:
+                # Closing a MemoryHandler flushes it but leaves its target open
+                target = getattr(handler, 'target', None)
+                handler.close()
+                if target is not None:
+                    target.flush()
+        if not keep_files:
+            cls._close_cached_handlers()
+    
+    @classmethod
+    def _close_cached_handlers(cls):
+        """Close and forget every cached file handler."""
+        for handler in cls._handler_cache.values():
+            handler.close()
+        cls._handler_cache.clear()
     
-    def info(self, message: str):
+    # The wrappers pass arguments through so callers can use lazy %-style
+    # formatting: records below every handler's level are never formatted,
+    # and the rest are formatted by the listener's handlers, not the caller
+    
+    def info(self, message: str, *args, **kwargs):
         """Log info message."""
-        self.logger.info(message)
+        self.logger.info(message, *args, **kwargs)
     
-    def warning(self, message: str):
+    def warning(self, message: str, *args, **kwargs):
         """Log warning message."""
-        self.logger.warning(message)
+        self.logger.warning(message, *args, **kwargs)
     
-    def error(self, message: str):
+    def error(self, message: str, *args, **kwargs):
         """Log error message."""
-        self.logger.error(message)
+        self.logger.error(message, *args, **kwargs)
     
-    def debug(self, message: str):
+    def debug(self, message: str, *args, **kwargs):
         """Log debug message."""
-        self.logger.debug(message)
+        self.logger.debug(message, *args, **kwargs)
     
     def log_calculation(self, calculation):
         """Log a calculation."""
-        self.info(f"Calculation performed: {calculation}")
\ No newline at end of file
+        # Calculation.__str__ runs when a handler writes the record, not here
+        self.logger.info("Calculation performed: %s", calculation)
+
+# Drain the queue before the interpreter exits
+atexit.register(Logger.shutdown)
\ No newline at end of file
@@ -2,28 +2,37 @@
 Operation classes and factory for the calculator application.
 """
 
-from abc import ABC, abstractmethod
-from typing import Dict, Type
+import math
+import operator
+from typing import Dict, Tuple, Type
 from app.exceptions import OperationError, DivisionByZeroError
 
-class Operation(ABC):
-    """Abstract base class for calculator operations."""
+class Operation:
+    """Base class for calculator operations."""
+    
+    # A plain base class (no ABCMeta) with empty slots: operations carry no
+    # per-instance state, so instances need no __dict__
+    __slots__ = ()
+    
+    # Pure operations always give the same result for the same operands,
+    # which lets the calculator memoize them
+    is_pure: bool = True
     
-    @abstractmethod
     def execute(self, a: float, b: float) -> float:
         """Execute the operation on two operands."""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def get_symbol(self) -> str:
         """Get the symbol representing this operation."""
-        pass
+        raise NotImplementedError
 
 class AddOperation(Operation):
     """Addition operation."""
     
-    def execute(self, a: float, b: float) -> float:
-        return a + b
+    __slots__ = ()
+    
+    # Trivial operations use the C-level operator functions directly
+    execute = staticmethod(operator.add)
     
     def get_symbol(self) -> str:
         return "+"
@@ -31,8 +40,9 @@ class AddOperation(Operation):
 class SubtractOperation(Operation):
     """Subtraction operation."""
     
-    def execute(self, a: float, b: float) -> float:
-        return a - b
+    __slots__ = ()
+    
+    execute = staticmethod(operator.sub)
     
     def get_symbol(self) -> str:
         return "-"
@@ -40,8 +50,9 @@ class SubtractOperation(Operation):
 class MultiplyOperation(Operation):
     """Multiplication operation."""
     
-    def execute(self, a: float, b: float) -> float:
-        return a * b
+    __slots__ = ()
+    
+    execute = staticmethod(operator.mul)
     
     def get_symbol(self) -> str:
         return "*"
@@ -49,6 +60,8 @@ class MultiplyOperation(Operation):
 class DivideOperation(Operation):
     """Division operation."""
     
+    __slots__ = ()
+    
     def execute(self, a: float, b: float) -> float:
         if b == 0:
             raise DivisionByZeroError("Cannot divide by zero")
@@ -60,6 +73,8 @@ class DivideOperation(Operation):
 class PowerOperation(Operation):
     """Power operation."""
     
+    __slots__ = ()
+    
     def execute(self, a: float, b: float) -> float:
         try:
             return a ** b
@@ -72,6 +87,8 @@ class PowerOperation(Operation):
 class RootOperation(Operation):
     """Root operation (a^(1/b))."""
     
+    __slots__ = ()
+    
     def execute(self, a: float, b: float) -> float:
         if b == 0:
             raise DivisionByZeroError("Cannot calculate root with zero index")
@@ -102,9 +119,13 @@ class RootOperation(Operation):
 class ModulusOperation(Operation):
     """Modulus operation."""
     
+    __slots__ = ()
+    
     def execute(self, a: float, b: float) -> float:
         if b == 0:
             raise DivisionByZeroError("Cannot calculate modulus with zero divisor")
+        # Kept as % rather than math.fmod: the result takes the sign of the
+        # divisor, which users of the REPL and saved histories rely on
         return a % b
     
     def get_symbol(self) -> str:
@@ -113,10 +134,18 @@ class ModulusOperation(Operation):
 class IntegerDivideOperation(Operation):
     """Integer division operation."""
     
+    __slots__ = ()
+    
     def execute(self, a: float, b: float) -> float:
         if b == 0:
             raise DivisionByZeroError("Cannot divide by zero")
-        return float(int(a // b))
+        # Floor division of floats is already a whole-valued float; it can
+        # still be NaN or infinite for infinite operands
+        result = a // b
+        if not math.isfinite(result):
+            raise OperationError("Integer division result is not finite")
+        # float() covers int operands; adding 0.0 turns -0.0 into 0.0
+        return float(result) + 0.0
     
     def get_symbol(self) -> str:
         return "//"
@@ -124,6 +153,8 @@ class IntegerDivideOperation(Operation):
 class PercentageOperation(Operation):
     """Percentage calculation (a/b * 100)."""
     
+    __slots__ = ()
+    
     def execute(self, a: float, b: float) -> float:
         if b == 0:
             raise DivisionByZeroError("Cannot calculate percentage with zero base")
@@ -135,8 +166,10 @@ class PercentageOperation(Operation):
 class AbsoluteDifferenceOperation(Operation):
     """Absolute difference operation."""
     
+    __slots__ = ()
+    
     def execute(self, a: float, b: float) -> float:
-        return abs(a - b)
+        return math.fabs(a - b)
     
     def get_symbol(self) -> str:
         return "|a-b|"
@@ -157,17 +190,39 @@ class OperationFactory:
         'abs_diff': AbsoluteDifferenceOperation
     }
     
+    # Operations are stateless, so one shared instance per name is enough
+    _instances: Dict[str, Operation] = {
+        name: operation_class() for name, operation_class in _operations.items()
+    }
+    
+    # Lookups between operation names and the symbols stored in history
+    _symbols: Dict[str, str] = {
+        name: operation.get_symbol() for name, operation in _instances.items()
+    }
+    _names: Dict[str, str] = {symbol: name for name, symbol in _symbols.items()}
+    
     @classmethod
     def create_operation(cls, operation_name: str) -> Operation:
-        """Create an operation instance by name."""
-        operation_class = cls._operations.get(operation_name.lower())
-        if not operation_class:
+        """Get the shared operation instance for a name."""
+        operation = cls._instances.get(operation_name.lower())
+        if operation is None:
             raise OperationError(f"Unknown operation: {operation_name}")
-        return operation_class()
+        return operation
     
     @classmethod
     def get_available_operations(cls) -> list:
         """Get list of available operation names."""
         return list(cls._operations.keys())
+    
+    @classmethod
+    def describe(cls, operation: str) -> Tuple[str, str]:
+        """
+        Get the (name, symbol) pair for an operation name or symbol.
+        
+        Unknown values are returned unchanged as both name and symbol.
+        """
+        if operation in cls._symbols:
+            return operation, cls._symbols[operation]
+        return cls._names.get(operation, operation), operation
 
 
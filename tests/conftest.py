@@ -2,25 +2,97 @@
 Pytest configuration and shared fixtures
 """
 import pytest
+import atexit
 import os
+import shutil
+import tempfile
 from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
+from typing import Dict, Tuple
+
+# Set before the app is imported: the Logger swaps its file and console
+# handlers for a NullHandler, so the suite never writes the log file
+os.environ.setdefault('CALCULATOR_TEST_MODE', '1')
+
+# Calculators built with the default config auto-save into a scratch history
+# directory (one per pytest-xdist worker), never the tracked history/ folder.
+# Registered before the app is imported, so this atexit hook runs after the
+# app's own exit-time auto-save flush
+_HISTORY_DIR = tempfile.mkdtemp(
+    prefix=f"calculator-{os.environ.get('PYTEST_XDIST_WORKER', 'tests')}-"
+)
+os.environ['CALCULATOR_HISTORY_DIR'] = _HISTORY_DIR
+atexit.register(shutil.rmtree, _HISTORY_DIR, ignore_errors=True)
+
+# Environment with every calculator setting removed, taken once at import so
+# no test can have modified it yet; the test-mode switch above is kept
+_CLEAN_ENV = {
+    k: v for k, v in os.environ.items()
+    if not k.startswith('CALCULATOR_') or k == 'CALCULATOR_TEST_MODE'
+}
+
 from app.calculator import Calculator
 from app.calculator_config import CalculatorConfig
 from app.operations import OperationFactory
 
 
+def pytest_collection_modifyitems(config, items):
+    """Leave benchmarks to runs that ask for them with --benchmark-only"""
+    if config.getoption("benchmark_only", default=False):
+        return
+    skip_benchmark = pytest.mark.skip(reason="benchmark; run with --benchmark-only")
+    for item in items:
+        if "benchmark" in getattr(item, "fixturenames", ()):
+            item.add_marker(skip_benchmark)
+
+
 @pytest.fixture
 def calculator():
     """Fixture to provide a fresh calculator instance"""
+    # Built per test rather than deep-copied from a session template: with the
+    # Logger singleton reused, construction is several times cheaper than a copy
     return Calculator()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def operation_factory():
-    """Fixture to provide an operation factory instance"""
+    """Fixture to provide an operation factory instance (stateless, so shared)"""
     return OperationFactory()
 
 
+@pytest.fixture
+def noop_observer():
+    """Fixture to provide an observer that ignores updates, for registration checks"""
+    from app.calculator import CalculatorObserver
+    
+    class NoopObserver(CalculatorObserver):
+        def update(self, calculation):
+            pass
+    
+    return NoopObserver()
+
+
+@pytest.fixture
+def repl_runner(monkeypatch, capsys):
+    """Fixture to run a REPL on a terminal over scripted input() replies and return its output"""
+    def run(repl, inputs):
+        replies = iter(inputs)
+        
+        def scripted_input(prompt=''):
+            # An exhausted script behaves like Ctrl-D; exception entries are raised
+            reply = next(replies, EOFError())
+            if isinstance(reply, BaseException):
+                raise reply
+            return reply
+        
+        monkeypatch.setattr('builtins.input', scripted_input)
+        monkeypatch.setattr('sys.stdin', SimpleNamespace(isatty=lambda: True))
+        repl.start()
+        return capsys.readouterr().out
+    
+    return run
+
+
 @pytest.fixture
 def temp_log_file(tmp_path):
     """Fixture to provide a temporary log file path"""
@@ -33,6 +105,17 @@ def temp_history_file(tmp_path):
     return tmp_path / "history.csv"
 
 
+@pytest.fixture(scope="session")
+def saved_history_csv(tmp_path_factory):
+    """Fixture to provide a history file saved once per session; tests must only read it"""
+    path = tmp_path_factory.mktemp("saved_history") / "history.csv"
+    calc = Calculator()
+    calc.calculate("add", 5.0, 3.0)
+    calc.calculate("subtract", 10.0, 4.0)
+    calc.save_history(str(path))
+    return path
+
+
 @pytest.fixture
 def temp_config_dir(tmp_path):
     """Fixture to provide temporary config directories"""
@@ -46,73 +129,126 @@ def temp_config_dir(tmp_path):
     }
 
 
+@pytest.fixture(scope="session")
+def clean_env_snapshot():
+    """Fixture to provide the session's clean environment snapshot (read-only)"""
+    return MappingProxyType(_CLEAN_ENV)
+
+
 @pytest.fixture
-def clean_environment(monkeypatch):
+def clean_environment(monkeypatch, clean_env_snapshot):
     """Fixture to provide clean environment variables"""
-    # Clear any existing calculator environment variables
-    env_vars = [
-        'CALCULATOR_LOG_DIR',
-        'CALCULATOR_HISTORY_DIR',
-        'CALCULATOR_MAX_HISTORY_SIZE',
-        'CALCULATOR_AUTO_SAVE',
-        'CALCULATOR_PRECISION',
-        'CALCULATOR_MAX_INPUT_VALUE',
-        'CALCULATOR_DEFAULT_ENCODING'
-    ]
-    for var in env_vars:
-        monkeypatch.delenv(var, raising=False)
+    # Swap in a copy of the snapshot in one step instead of deleting each
+    # CALCULATOR_* variable; child processes still inherit the real environment
+    monkeypatch.setattr(os, 'environ', dict(clean_env_snapshot))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_calculations():
-    """Fixture to provide sample calculation data"""
+    """Fixture to provide sample calculation data (shared, so a tuple)"""
     from app.calculation import Calculation
-    from app.operations import AddOperation, SubtractOperation, MultiplyOperation
     
-    return [
-        Calculation(AddOperation(), 5, 3),
-        Calculation(SubtractOperation(), 10, 2),
-        Calculation(MultiplyOperation(), 4, 5)
-    ]
+    return (
+        Calculation("+", 5.0, 3.0, 8.0),
+        Calculation("-", 10.0, 2.0, 8.0),
+        Calculation("*", 4.0, 5.0, 20.0)
+    )
 
 
 @pytest.fixture
-def mock_config(tmp_path, monkeypatch):
-    """Fixture to provide a mock configuration"""
-    log_dir = tmp_path / "logs"
-    history_dir = tmp_path / "history"
+def sample_calculations_mut(sample_calculations):
+    """Fixture to provide the sample calculations as a list the test may modify"""
+    return list(sample_calculations)
+
+
+@pytest.fixture(scope="session")
+def populated_history():
+    """Fixture to provide a shared history of five additions; tests must only read it"""
+    from app.calculation import Calculation
+    from app.history import HistoryManager
+    
+    history = HistoryManager()
+    history.append_calculations(
+        Calculation("add", float(i), 1.0, float(i + 1)) for i in range(5)
+    )
+    return history
+
+
+# Configurations built by mock_config, keyed by the environment they were read from
+_config_cache: Dict[Tuple[Tuple[str, str], ...], CalculatorConfig] = {}
+
+
+@pytest.fixture(scope="session")
+def mock_config_dirs(tmp_path_factory):
+    """Fixture to provide the log and history directories used by mock_config"""
+    base = tmp_path_factory.mktemp("mock_config")
+    return base / "logs", base / "history"
+
+
+@pytest.fixture
+def mock_config(mock_config_dirs, monkeypatch):
+    """
+    Fixture to provide a mock configuration
     
-    monkeypatch.setenv("CALCULATOR_LOG_DIR", str(log_dir))
-    monkeypatch.setenv("CALCULATOR_HISTORY_DIR", str(history_dir))
-    monkeypatch.setenv("CALCULATOR_MAX_HISTORY_SIZE", "100")
-    monkeypatch.setenv("CALCULATOR_PRECISION", "6")
-    monkeypatch.setenv("CALCULATOR_MAX_INPUT_VALUE", "1000000")
-    monkeypatch.setenv("CALCULATOR_AUTO_SAVE", "true")
+    The environment is the same for every test, so the configuration is
+    built once and reused; treat it as read-only.
+    """
+    log_dir, history_dir = mock_config_dirs
+    env = {
+        "CALCULATOR_LOG_DIR": str(log_dir),
+        "CALCULATOR_HISTORY_DIR": str(history_dir),
+        "CALCULATOR_MAX_HISTORY_SIZE": "100",
+        "CALCULATOR_PRECISION": "6",
+        "CALCULATOR_MAX_INPUT_VALUE": "1000000",
+        "CALCULATOR_AUTO_SAVE": "true",
+    }
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
     
-    return CalculatorConfig()
+    key = tuple(sorted(env.items()))
+    cached = _config_cache.get(key)
+    if cached is None:
+        cached = _config_cache[key] = CalculatorConfig()
+    return cached
 
 
 @pytest.fixture(autouse=True)
-def reset_singletons():
-    """Fixture to reset any singleton instances between tests"""
-    # This ensures each test gets a fresh state
+def reset_singletons(request):
+    """
+    Fixture to reset the Logger singleton for tests marked fresh_logger
+    
+    Other tests share one Logger for the whole session.
+    """
+    if 'fresh_logger' not in request.node.keywords:
+        yield
+        return
+    from app.logger import Logger
+    Logger._instance = None
     yield
-    # Cleanup code here if needed
+    Logger._instance = None
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def calculation_history_data():
-    """Fixture to provide sample history data for CSV operations"""
-    return [
+    """Fixture to provide sample history data for CSV operations (read-only rows)"""
+    return tuple(MappingProxyType(row) for row in (
         {'operation': 'add', 'operand1': 5, 'operand2': 3, 'result': 8, 'timestamp': '2024-01-01 12:00:00'},
         {'operation': 'subtract', 'operand1': 10, 'operand2': 2, 'result': 8, 'timestamp': '2024-01-01 12:01:00'},
         {'operation': 'multiply', 'operand1': 4, 'operand2': 5, 'result': 20, 'timestamp': '2024-01-01 12:02:00'}
-    ]
+    ))
+
+
+@pytest.fixture
+def calculator_with_two(calculator):
+    """Fixture to provide a calculator after two real calculations (8.0, 8.0), undoable"""
+    calculator.calculate("add", 5.0, 3.0)
+    calculator.calculate("subtract", 10.0, 2.0)
+    return calculator
 
 
 @pytest.fixture
 def populated_calculator(calculator, sample_calculations):
     """Fixture to provide a calculator with existing calculations"""
     for calc in sample_calculations:
-        calculator.history.add(calc)
+        calculator.history_manager.add_calculation(calc)
     return calculator
\ No newline at end of file
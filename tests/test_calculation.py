@@ -18,10 +18,10 @@ class TestCalculation:
         assert calc.operand1 == 5.0
         assert calc.operand2 == 3.0
         assert calc.result == 8.0
-        assert calc.timestamp == timestamp
+        assert calc.timestamp_dt == timestamp
     
     def test_init_without_timestamp(self):
-        """Test initialization without timestamp - uses datetime.now()"""
+        """Test initialization without timestamp - uses the current time"""
         before = datetime.now()
         calc = Calculation("subtract", 10.0, 3.0, 7.0)
         after = datetime.now()
@@ -30,28 +30,38 @@ class TestCalculation:
         assert calc.operand1 == 10.0
         assert calc.operand2 == 3.0
         assert calc.result == 7.0
-        assert before <= calc.timestamp <= after
+        assert before <= calc.timestamp_dt <= after
     
     def test_init_with_none_timestamp(self):
-        """Test initialization with None timestamp - uses datetime.now()"""
+        """Test initialization with None timestamp - uses the current time"""
         calc = Calculation("multiply", 4.0, 5.0, 20.0, None)
         
         assert calc.operation == "multiply"
-        assert isinstance(calc.timestamp, datetime)
+        assert isinstance(calc.timestamp, int)
+        assert isinstance(calc.timestamp_dt, datetime)
     
-    def test_str_method(self):
-        """Test __str__ method"""
-        calc = Calculation("add", 5.0, 3.0, 8.0)
-        result = str(calc)
-        
-        assert result == "5.0 add 3.0 = 8.0"
+    def test_init_with_epoch_microseconds(self):
+        """Test initialization with an integer epoch-microsecond timestamp"""
+        timestamp = datetime(2024, 1, 1, 12, 0, 0, 250000)
+        micros = int(datetime(2024, 1, 1, 12, 0, 0).timestamp()) * 1_000_000 + 250000
+        calc = Calculation("add", 5.0, 3.0, 8.0, micros)
+        
+        assert calc.timestamp == micros
+        assert calc.timestamp_dt == timestamp
     
-    def test_str_with_different_operation(self):
-        """Test __str__ with different operation"""
-        calc = Calculation("divide", 20.0, 4.0, 5.0)
-        result = str(calc)
+    @pytest.mark.parametrize("operation,operand1,operand2,result,expected", [
+        ("add", 5.0, 3.0, 8.0, "5.0 add 3.0 = 8.0"),
+        ("divide", 20.0, 4.0, 5.0, "20.0 divide 4.0 = 5.0"),
+        ("add", -5.0, -3.0, -8.0, "-5.0 add -3.0 = -8.0"),
+    ])
+    def test_str(self, operation, operand1, operand2, result, expected):
+        """Test __str__ method"""
+        calc = Calculation(operation, operand1, operand2, result)
         
-        assert result == "20.0 divide 4.0 = 5.0"
+        assert calc.operand1 == operand1
+        assert calc.operand2 == operand2
+        assert calc.result == result
+        assert str(calc) == expected
     
     def test_repr_method(self):
         """Test __repr__ method"""
@@ -76,7 +86,7 @@ class TestCalculation:
         assert result['operand1'] == 10.0
         assert result['operand2'] == 3.0
         assert result['result'] == 1.0
-        assert result['timestamp'] == "2024-06-15T14:30:00"
+        assert result['timestamp'] == int(timestamp.timestamp()) * 1_000_000
     
     def test_to_dict_with_microseconds(self):
         """Test to_dict preserves microseconds in timestamp"""
@@ -84,16 +94,23 @@ class TestCalculation:
         calc = Calculation("add", 1.0, 2.0, 3.0, timestamp)
         result = calc.to_dict()
         
-        assert result['timestamp'] == "2024-01-01T12:00:00.123456"
+        assert result['timestamp'] % 1_000_000 == 123456
+        assert Calculation.from_dict(result).timestamp_dt == timestamp
     
-    def test_from_dict_method(self):
-        """Test from_dict class method"""
+    @pytest.mark.parametrize("timestamp,expected", [
+        ('2024-03-20T10:15:30', datetime(2024, 3, 20, 10, 15, 30)),
+        ('2024-12-25T18:45:30.654321', datetime(2024, 12, 25, 18, 45, 30, 654321)),
+        # Epoch microseconds, as written to CSV
+        ('1704110400123456', datetime.fromtimestamp(1704110400).replace(microsecond=123456)),
+    ])
+    def test_from_dict_method(self, timestamp, expected):
+        """Test from_dict class method with each stored timestamp format"""
         data = {
             'operation': 'subtract',
             'operand1': 15.0,
             'operand2': 7.0,
             'result': 8.0,
-            'timestamp': '2024-03-20T10:15:30'
+            'timestamp': timestamp
         }
         
         calc = Calculation.from_dict(data)
@@ -102,7 +119,7 @@ class TestCalculation:
         assert calc.operand1 == 15.0
         assert calc.operand2 == 7.0
         assert calc.result == 8.0
-        assert calc.timestamp == datetime(2024, 3, 20, 10, 15, 30)
+        assert calc.timestamp_dt == expected
     
     def test_from_dict_converts_string_numbers(self):
         """Test from_dict converts string numbers to float"""
@@ -123,21 +140,6 @@ class TestCalculation:
         assert isinstance(calc.operand2, float)
         assert isinstance(calc.result, float)
     
-    def test_from_dict_with_microseconds(self):
-        """Test from_dict parses microseconds correctly"""
-        data = {
-            'operation': 'divide',
-            'operand1': 10.0,
-            'operand2': 3.0,
-            'result': 3.333,
-            'timestamp': '2024-12-25T18:45:30.654321'
-        }
-        
-        calc = Calculation.from_dict(data)
-        
-        assert calc.timestamp == datetime(2024, 12, 25, 18, 45, 30, 654321)
-        assert calc.timestamp.microsecond == 654321
-    
     def test_round_trip_to_dict_from_dict(self):
         """Test complete round trip: to_dict then from_dict"""
         original = Calculation(
@@ -160,15 +162,6 @@ class TestCalculation:
         assert restored.result == original.result
         assert restored.timestamp == original.timestamp
     
-    def test_with_negative_numbers(self):
-        """Test with negative operands"""
-        calc = Calculation("add", -5.0, -3.0, -8.0)
-        
-        assert calc.operand1 == -5.0
-        assert calc.operand2 == -3.0
-        assert calc.result == -8.0
-        assert str(calc) == "-5.0 add -3.0 = -8.0"
-    
     def test_with_zero_values(self):
         """Test with zero values"""
         calc = Calculation("multiply", 0.0, 100.0, 0.0)
@@ -183,4 +176,12 @@ class TestCalculation:
         
         assert calc.operand1 == 10.123456789
         assert calc.operand2 == 3.987654321
-        assert calc.result == 2.54
\ No newline at end of file
+        assert calc.result == 2.54
+    
+    def test_uses_slots(self):
+        """Test calculations carry no per-instance __dict__"""
+        calc = Calculation("add", 1.0, 2.0, 3.0)
+        
+        assert not hasattr(calc, '__dict__')
+        with pytest.raises(AttributeError):
+            calc.extra = "value"
\ No newline at end of file
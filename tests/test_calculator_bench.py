@@ -0,0 +1,74 @@
+"""
+Benchmarks for the calculator hot paths (run with --benchmark-only)
+"""
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from app.calculator import Calculator
+
+
+@pytest.mark.benchmark(group="calculate")
+def test_bench_add(benchmark, calculator):
+    """Benchmark a single scalar calculation"""
+    result = benchmark.pedantic(
+        calculator.calculate, args=("add", 5, 3),
+        rounds=50, iterations=1000, warmup_rounds=5
+    )
+    
+    assert result == 8.0
+
+
+@pytest.mark.benchmark(group="calculate")
+def test_bench_calculate_many(benchmark, calculator):
+    """Benchmark a run of calculations through calculate_many"""
+    calculations = [("add", float(i), 1.0) for i in range(100)]
+    
+    results = benchmark(calculator.calculate_many, calculations)
+    
+    assert results[-1] == 100.0
+
+
+def _calculator_with_two(undone: bool = False):
+    """Build a calculator holding two calculations, optionally with the last undone"""
+    calc = Calculator()
+    calc.calculate_many([("add", 1, 1), ("add", 2, 2)])
+    if undone:
+        calc.undo()
+    return (calc,), {}
+
+
+@pytest.mark.benchmark(group="undo_redo")
+def test_bench_undo(benchmark):
+    """Benchmark undo, rebuilding the calculator before every round"""
+    result = benchmark.pedantic(
+        Calculator.undo, setup=_calculator_with_two, rounds=100, iterations=1
+    )
+    
+    # undo returns False when there is nothing to undo, which would be fast
+    assert result is True
+
+
+@pytest.mark.benchmark(group="undo_redo")
+def test_bench_redo(benchmark):
+    """Benchmark redo, rebuilding a calculator with an undone change every round"""
+    result = benchmark.pedantic(
+        Calculator.redo, setup=lambda: _calculator_with_two(undone=True),
+        rounds=100, iterations=1
+    )
+    
+    assert result is True
+
+
+@pytest.mark.benchmark(group="history_io")
+def test_bench_save_load_round_trip(benchmark, calculator_with_two, temp_history_file):
+    """Benchmark saving the history to CSV and loading it back"""
+    calc = Calculator()
+    
+    def round_trip():
+        calculator_with_two.save_history(str(temp_history_file))
+        calc.history_manager.load_from_csv(temp_history_file)
+    
+    benchmark(round_trip)
+    
+    assert calc.get_history_count() == 2
@@ -2,25 +2,32 @@
 Comprehensive tests for REPL to achieve 100% coverage
 """
 import pytest
-from unittest.mock import Mock, patch, mock_open
-from pathlib import Path
+from unittest.mock import Mock
 from io import StringIO
 
 from app.calculator_repl import REPL
 from app.calculator import Calculator
 from app.exceptions import CalculatorError, OperationError, ValidationError, HistoryError
 from app.calculation import Calculation
-from app.operations import Operation
+
+
+@pytest.fixture
+def calc():
+    """Fixture to provide a mock calculator for the REPL under test"""
+    return Mock(spec=Calculator)
+
+
+@pytest.fixture
+def repl(calc):
+    """Fixture to provide a REPL bound to the mock calculator"""
+    return REPL(calc)
 
 
 class TestREPLInitialization:
     """Test REPL initialization"""
     
-    def test_init(self):
+    def test_init(self, calc, repl):
         """Test REPL initialization"""
-        calc = Mock(spec=Calculator)
-        repl = REPL(calc)
-        
         assert repl.calculator is calc
         assert repl.running is False
         assert len(repl.commands) == 18
@@ -29,89 +36,128 @@ class TestREPLInitialization:
 
 
 class TestREPLStart:
-    """Test REPL start method"""
+    """Test REPL start method on an interactive terminal"""
     
-    def test_start_with_exit(self):
+    def test_start_with_exit(self, repl, repl_runner):
         """Test starting REPL and exiting"""
-        calc = Mock(spec=Calculator)
-        repl = REPL(calc)
-        
-        with patch('builtins.input', side_effect=['exit']):
-            with patch('builtins.print') as mock_print:
-                repl.start()
+        output = repl_runner(repl, ['exit'])
         
         assert repl.running is False
-        assert any('Welcome' in str(call) for call in mock_print.call_args_list)
+        assert 'Welcome' in output
     
-    def test_start_with_empty_input(self):
+    def test_start_with_empty_input(self, repl, repl_runner):
         """Test REPL with empty input"""
-        calc = Mock(spec=Calculator)
-        repl = REPL(calc)
-        
-        with patch('builtins.input', side_effect=['', '  ', 'exit']):
-            with patch('builtins.print'):
-                repl.start()
+        repl_runner(repl, ['', '  ', 'exit'])
         
         assert repl.running is False
     
-    def test_start_with_keyboard_interrupt(self):
+    def test_start_with_keyboard_interrupt(self, repl, repl_runner):
         """Test REPL with KeyboardInterrupt"""
-        calc = Mock(spec=Calculator)
-        repl = REPL(calc)
-        
-        with patch('builtins.input', side_effect=[KeyboardInterrupt(), 'exit']):
-            with patch('builtins.print') as mock_print:
-                repl.start()
+        output = repl_runner(repl, [KeyboardInterrupt(), 'exit'])
         
-        assert any('exit' in str(call).lower() for call in mock_print.call_args_list)
+        assert 'exit' in output.lower()
     
-    def test_start_with_eof_error(self):
+    def test_start_with_eof_error(self, repl, repl_runner):
         """Test REPL with EOFError"""
-        calc = Mock(spec=Calculator)
-        repl = REPL(calc)
-        
-        with patch('builtins.input', side_effect=EOFError()):
-            with patch('builtins.print'):
-                repl.start()
+        repl_runner(repl, [])
         
         assert repl.running is True  # Loop breaks but flag stays True
+    
+    def test_start_with_calculation(self, calculator, repl_runner):
+        """Test a calculation typed at the prompt against a real calculator"""
+        output = repl_runner(REPL(calculator), ['add 5 3', 'exit'])
+        
+        assert '8' in output
+        assert calculator.get_history_count() == 1
+    
+    def test_output_follows_stdout_after_session(self, repl, repl_runner, monkeypatch):
+        """Test a finished session does not keep writing to its old stdout"""
+        repl_runner(repl, ['exit'])
+        replacement = StringIO()
+        monkeypatch.setattr('sys.stdout', replacement)
+        
+        repl._handle_help('help', [])
+        
+        assert 'AVAILABLE COMMANDS' in replacement.getvalue()
+
+
+class TestREPLScriptedInput:
+    """Test REPL start method with piped (non-terminal) stdin"""
+    
+    def test_start_reads_lines_from_stdin(self, calc, repl, monkeypatch, capsys):
+        """Test commands are read from stdin without calling input()"""
+        calc.calculate.return_value = 8.0
+        monkeypatch.setattr('sys.stdin', StringIO("add 5 3\n\nexit\nadd 1 1\n"))
+        mock_input = Mock()
+        monkeypatch.setattr('builtins.input', mock_input)
+        
+        repl.start()
+        output = capsys.readouterr().out
+        
+        mock_input.assert_not_called()
+        calc.calculate.assert_called_once_with('add', 5.0, 3.0)
+        assert "Result: 8.0" in output
+        assert output.count("\n> ") == 3
+        assert repl.running is False
+    
+    def test_start_handles_interrupt_while_reading_stdin(self, repl, monkeypatch, capsys):
+        """Test Ctrl-C while waiting on piped stdin is reported, not raised"""
+        class InterruptedStdin:
+            def __init__(self):
+                self._lines = iter([KeyboardInterrupt(), "exit\n"])
+            
+            def __iter__(self):
+                return self
+            
+            def __next__(self):
+                line = next(self._lines)
+                if isinstance(line, BaseException):
+                    raise line
+                return line
+            
+            def isatty(self):
+                return False
+        
+        monkeypatch.setattr('sys.stdin', InterruptedStdin())
+        
+        repl.start()
+        output = capsys.readouterr().out
+        
+        assert "Use 'exit' to quit" in output
+        assert repl.running is False
+    
+    def test_start_stops_at_end_of_stdin(self, repl, monkeypatch):
+        """Test the loop ends when stdin is exhausted"""
+        monkeypatch.setattr('sys.stdin', StringIO("help\n"))
+        
+        repl.start()
+        
+        assert repl.running is True
 
 
 class TestParseCommand:
     """Test command parsing"""
     
-    def test_parse_command_with_args(self):
+    def test_parse_command_with_args(self, repl):
         """Test parsing command with arguments"""
-        calc = Mock(spec=Calculator)
-        repl = REPL(calc)
-        
         command, args = repl.parse_command("add 5 3")
         assert command == "add"
         assert args == ["5", "3"]
     
-    def test_parse_command_without_args(self):
+    def test_parse_command_without_args(self, repl):
         """Test parsing command without arguments"""
-        calc = Mock(spec=Calculator)
-        repl = REPL(calc)
-        
         command, args = repl.parse_command("history")
         assert command == "history"
         assert args == []
     
-    def test_parse_command_empty_string(self):
+    def test_parse_command_empty_string(self, repl):
         """Test parsing empty string"""
-        calc = Mock(spec=Calculator)
-        repl = REPL(calc)
-        
         command, args = repl.parse_command("")
         assert command == ""
         assert args == []
     
-    def test_parse_command_case_insensitive(self):
+    def test_parse_command_case_insensitive(self, repl):
         """Test command parsing is case insensitive"""
-        calc = Mock(spec=Calculator)
-        repl = REPL(calc)
-        
         command, args = repl.parse_command("ADD 5 3")
         assert command == "add"
 
@@ -119,364 +165,276 @@ class TestParseCommand:
 class TestProcessInput:
     """Test input processing"""
     
-    def test_process_unknown_command(self):
+    def test_process_unknown_command(self, repl, capsys):
         """Test processing unknown command"""
-        calc = Mock(spec=Calculator)
-        repl = REPL(calc)
+        repl._process_input("unknown")
+        output = capsys.readouterr().out
+        
+        assert "Unknown command" in output
+    
+    def test_process_arithmetic_command(self, calc, repl, capsys):
+        """Test arithmetic commands are routed straight to the operation handler"""
+        calc.calculate.return_value = 8
         
-        with patch('builtins.print') as mock_print:
-            repl._process_input("unknown")
+        repl._process_input("  ADD 5   3 ")
+        output = capsys.readouterr().out
         
-        mock_print.assert_called()
-        call_args = str(mock_print.call_args_list)
-        assert "Unknown command" in call_args
+        calc.calculate.assert_called_once_with('add', 5.0, 3.0)
+        assert output.splitlines()[-1] == "Result: 8"
 
 
 class TestHandleOperation:
     """Test operation handling"""
     
-    def test_handle_operation_success(self):
+    def test_handle_operation_success(self, calc, repl, capsys):
         """Test successful operation"""
-        calc = Mock(spec=Calculator)
         calc.calculate.return_value = 8
-        repl = REPL(calc)
         
-        with patch('builtins.print') as mock_print:
-            repl._handle_operation('add', ['5', '3'])
+        repl._handle_operation('add', ['5', '3'])
+        output = capsys.readouterr().out
         
         calc.calculate.assert_called_once_with('add', 5.0, 3.0)
-        mock_print.assert_called_with("Result: 8")
+        assert output.splitlines()[-1] == "Result: 8"
     
-    def test_handle_operation_wrong_arg_count(self):
+    def test_handle_operation_wrong_arg_count(self, repl, capsys):
         """Test operation with wrong number of arguments"""
-        calc = Mock(spec=Calculator)
-        repl = REPL(calc)
-        
-        with patch('builtins.print') as mock_print:
-            repl._handle_operation('add', ['5'])
+        repl._handle_operation('add', ['5'])
+        output = capsys.readouterr().out
         
-        call_args = str(mock_print.call_args_list)
-        assert "requires exactly 2 operands" in call_args
-        assert "Usage:" in call_args
+        assert "requires exactly 2 operands" in output
+        assert "Usage:" in output
     
-    def test_handle_operation_invalid_number(self):
+    def test_handle_operation_invalid_number(self, repl, capsys):
         """Test operation with invalid number format"""
-        calc = Mock(spec=Calculator)
-        repl = REPL(calc)
-        
-        with patch('builtins.print') as mock_print:
-            repl._handle_operation('add', ['abc', '3'])
+        repl._handle_operation('add', ['abc', '3'])
+        output = capsys.readouterr().out
         
-        mock_print.assert_called_with("Error: Invalid number format. Please enter valid numbers.")
+        assert output.splitlines()[-1] == "Error: Invalid number format. Please enter valid numbers."
     
-    def test_handle_operation_operation_error(self):
-        """Test operation raising OperationError"""
-        calc = Mock(spec=Calculator)
-        calc.calculate.side_effect = OperationError("Division by zero")
-        repl = REPL(calc)
-        
-        with patch('builtins.print') as mock_print:
-            repl._handle_operation('divide', ['5', '0'])
-        
-        mock_print.assert_called_with("Operation Error: Division by zero")
-    
-    def test_handle_operation_validation_error(self):
-        """Test operation raising ValidationError"""
-        calc = Mock(spec=Calculator)
-        calc.calculate.side_effect = ValidationError("Invalid operand")
-        repl = REPL(calc)
-        
-        with patch('builtins.print') as mock_print:
-            repl._handle_operation('add', ['5', '3'])
-        
-        mock_print.assert_called_with("Validation Error: Invalid operand")
-    
-    def test_handle_operation_calculator_error(self):
-        """Test operation raising CalculatorError"""
-        calc = Mock(spec=Calculator)
-        calc.calculate.side_effect = CalculatorError("General error")
-        repl = REPL(calc)
+    @pytest.mark.parametrize("error,expected", [
+        (OperationError("Division by zero"), "Operation Error: Division by zero"),
+        (ValidationError("Invalid operand"), "Validation Error: Invalid operand"),
+        (CalculatorError("General error"), "Calculator Error: General error"),
+    ])
+    def test_handle_operation_errors(self, calc, repl, capsys, error, expected):
+        """Test each calculator error is reported with its own prefix"""
+        calc.calculate.side_effect = error
         
-        with patch('builtins.print') as mock_print:
-            repl._handle_operation('add', ['5', '3'])
+        repl._handle_operation('divide', ['5', '0'])
+        output = capsys.readouterr().out
         
-        mock_print.assert_called_with("Calculator Error: General error")
+        assert output.splitlines()[-1] == expected
 
 
 class TestHandleHistory:
     """Test history handling"""
     
-    def test_handle_history_empty(self):
+    def test_handle_history_empty(self, calc, repl, capsys):
         """Test displaying empty history"""
-        calc = Mock(spec=Calculator)
         calc.get_history.return_value = []
-        repl = REPL(calc)
         
-        with patch('builtins.print') as mock_print:
-            repl._handle_history('history', [])
+        repl._handle_history('history', [])
+        output = capsys.readouterr().out
         
-        mock_print.assert_called_with("History is empty.")
+        assert output.splitlines()[-1] == "History is empty."
     
-    def test_handle_history_with_calculations(self):
+    def test_handle_history_with_calculations(self, calc, repl, capsys):
         """Test displaying history with calculations"""
-        calc = Mock(spec=Calculator)
+        # History records the operation symbol; older files may hold the name
+        calc1 = Calculation("+", 5, 3, 8)
+        calc2 = Calculation("multiply", 4, 2, 8)
         
-        # Create mock calculations
-        mock_calc1 = Mock(spec=Calculation)
-        mock_calc1.operation = Mock(spec=Operation)
-        mock_calc1.operation.name = "add"
-        mock_calc1.operation.symbol = "+"
-        mock_calc1.operand1 = 5
-        mock_calc1.operand2 = 3
-        mock_calc1.result = 8
+        calc.get_history.return_value = [calc1, calc2]
         
-        mock_calc2 = Mock(spec=Calculation)
-        mock_calc2.operation = Mock(spec=Operation)
-        mock_calc2.operation.name = "multiply"
-        mock_calc2.operation.symbol = "*"
-        mock_calc2.operand1 = 4
-        mock_calc2.operand2 = 2
-        mock_calc2.result = 8
+        repl._handle_history('history', [])
+        output = capsys.readouterr().out
         
-        calc.get_history.return_value = [mock_calc1, mock_calc2]
-        repl = REPL(calc)
-        
-        with patch('builtins.print') as mock_print:
-            repl._handle_history('history', [])
-        
-        call_args = str(mock_print.call_args_list)
-        assert "CALCULATION HISTORY" in call_args
-        assert "1. 5 + 3 = 8 (add)" in call_args
-        assert "2. 4 * 2 = 8 (multiply)" in call_args
+        assert "CALCULATION HISTORY" in output
+        assert "1. 5 + 3 = 8 (add)" in output
+        assert "2. 4 * 2 = 8 (multiply)" in output
 
 
 class TestHandleClear:
     """Test clear handling"""
     
-    def test_handle_clear(self):
+    def test_handle_clear(self, calc, repl, capsys):
         """Test clearing history"""
-        calc = Mock(spec=Calculator)
-        repl = REPL(calc)
-        
-        with patch('builtins.print') as mock_print:
-            repl._handle_clear('clear', [])
+        repl._handle_clear('clear', [])
+        output = capsys.readouterr().out
         
         calc.clear_history.assert_called_once()
-        mock_print.assert_called_with("History cleared successfully.")
+        assert output.splitlines()[-1] == "History cleared successfully."
 
 
 class TestHandleUndo:
     """Test undo handling"""
     
-    def test_handle_undo_success(self):
+    def test_handle_undo_success(self, calc, repl, capsys):
         """Test successful undo"""
-        calc = Mock(spec=Calculator)
-        repl = REPL(calc)
-        
-        with patch('builtins.print') as mock_print:
-            repl._handle_undo('undo', [])
+        repl._handle_undo('undo', [])
+        output = capsys.readouterr().out
         
         calc.undo.assert_called_once()
-        mock_print.assert_called_with("Undid last calculation.")
+        assert output.splitlines()[-1] == "Undid last calculation."
     
-    def test_handle_undo_error(self):
+    def test_handle_undo_error(self, calc, repl, capsys):
         """Test undo with HistoryError"""
-        calc = Mock(spec=Calculator)
         calc.undo.side_effect = HistoryError("Nothing to undo")
-        repl = REPL(calc)
         
-        with patch('builtins.print') as mock_print:
-            repl._handle_undo('undo', [])
+        repl._handle_undo('undo', [])
+        output = capsys.readouterr().out
         
-        mock_print.assert_called_with("Error: Nothing to undo")
+        assert output.splitlines()[-1] == "Error: Nothing to undo"
 
 
 class TestHandleRedo:
     """Test redo handling"""
     
-    def test_handle_redo_success(self):
+    def test_handle_redo_success(self, calc, repl, capsys):
         """Test successful redo"""
-        calc = Mock(spec=Calculator)
-        repl = REPL(calc)
-        
-        with patch('builtins.print') as mock_print:
-            repl._handle_redo('redo', [])
+        repl._handle_redo('redo', [])
+        output = capsys.readouterr().out
         
         calc.redo.assert_called_once()
-        mock_print.assert_called_with("Redid last calculation.")
+        assert output.splitlines()[-1] == "Redid last calculation."
     
-    def test_handle_redo_error(self):
+    def test_handle_redo_error(self, calc, repl, capsys):
         """Test redo with HistoryError"""
-        calc = Mock(spec=Calculator)
         calc.redo.side_effect = HistoryError("Nothing to redo")
-        repl = REPL(calc)
         
-        with patch('builtins.print') as mock_print:
-            repl._handle_redo('redo', [])
+        repl._handle_redo('redo', [])
+        output = capsys.readouterr().out
         
-        mock_print.assert_called_with("Error: Nothing to redo")
+        assert output.splitlines()[-1] == "Error: Nothing to redo"
 
 
 class TestHandleSave:
     """Test save handling"""
     
-    def test_handle_save_default_filename(self):
+    def test_handle_save_default_filename(self, calc, repl, capsys):
         """Test saving with default filename"""
-        calc = Mock(spec=Calculator)
-        repl = REPL(calc)
-        
-        with patch('builtins.print') as mock_print:
-            repl._handle_save('save', [])
+        repl._handle_save('save', [])
+        output = capsys.readouterr().out
         
         calc.save_history.assert_called_once()
         call_args = calc.save_history.call_args[0][0]
         assert str(call_args) == "history.csv"
         
-        call_str = str(mock_print.call_args_list)
-        assert "History saved to" in call_str
+        assert "History saved to" in output
     
-    def test_handle_save_custom_filename(self):
+    def test_handle_save_custom_filename(self, calc, repl):
         """Test saving with custom filename"""
-        calc = Mock(spec=Calculator)
-        repl = REPL(calc)
-        
-        with patch('builtins.print') as mock_print:
-            repl._handle_save('save', ['custom.csv'])
+        repl._handle_save('save', ['custom.csv'])
         
         calc.save_history.assert_called_once()
         call_args = calc.save_history.call_args[0][0]
         assert str(call_args) == "custom.csv"
     
-    def test_handle_save_error(self):
+    def test_handle_save_error(self, calc, repl, capsys):
         """Test save with exception"""
-        calc = Mock(spec=Calculator)
         calc.save_history.side_effect = Exception("Write error")
-        repl = REPL(calc)
         
-        with patch('builtins.print') as mock_print:
-            repl._handle_save('save', [])
+        repl._handle_save('save', [])
+        output = capsys.readouterr().out
         
-        mock_print.assert_called_with("Error saving history: Write error")
+        assert output.splitlines()[-1] == "Error saving history: Write error"
 
 
 class TestHandleLoad:
     """Test load handling"""
     
-    def test_handle_load_default_filename(self):
+    def test_handle_load_default_filename(self, calc, repl, capsys):
         """Test loading with default filename"""
-        calc = Mock(spec=Calculator)
-        repl = REPL(calc)
-        
-        with patch('builtins.print') as mock_print:
-            repl._handle_load('load', [])
+        repl._handle_load('load', [])
+        output = capsys.readouterr().out
         
         calc.load_history.assert_called_once()
         call_args = calc.load_history.call_args[0][0]
         assert str(call_args) == "history.csv"
         
-        call_str = str(mock_print.call_args_list)
-        assert "History loaded from" in call_str
+        assert "History loaded from" in output
     
-    def test_handle_load_custom_filename(self):
+    def test_handle_load_custom_filename(self, calc, repl):
         """Test loading with custom filename"""
-        calc = Mock(spec=Calculator)
-        repl = REPL(calc)
-        
-        with patch('builtins.print') as mock_print:
-            repl._handle_load('load', ['custom.csv'])
+        repl._handle_load('load', ['custom.csv'])
         
         calc.load_history.assert_called_once()
         call_args = calc.load_history.call_args[0][0]
         assert str(call_args) == "custom.csv"
     
-    def test_handle_load_file_not_found(self):
+    def test_handle_load_file_not_found(self, calc, repl, capsys):
         """Test load with FileNotFoundError"""
-        calc = Mock(spec=Calculator)
         calc.load_history.side_effect = FileNotFoundError()
-        repl = REPL(calc)
         
-        with patch('builtins.print') as mock_print:
-            repl._handle_load('load', ['missing.csv'])
+        repl._handle_load('load', ['missing.csv'])
+        output = capsys.readouterr().out
         
-        mock_print.assert_called_with("Error: File 'missing.csv' not found.")
+        assert output.splitlines()[-1] == "Error: File 'missing.csv' not found."
     
-    def test_handle_load_general_error(self):
+    def test_handle_load_general_error(self, calc, repl, capsys):
         """Test load with general exception"""
-        calc = Mock(spec=Calculator)
         calc.load_history.side_effect = Exception("Read error")
-        repl = REPL(calc)
         
-        with patch('builtins.print') as mock_print:
-            repl._handle_load('load', [])
+        repl._handle_load('load', [])
+        output = capsys.readouterr().out
         
-        mock_print.assert_called_with("Error loading history: Read error")
+        assert output.splitlines()[-1] == "Error loading history: Read error"
 
 
 class TestHandleHelp:
     """Test help handling"""
     
-    def test_handle_help(self):
+    def test_handle_help(self, repl, capsys):
         """Test displaying help"""
-        calc = Mock(spec=Calculator)
-        repl = REPL(calc)
-        
-        with patch('builtins.print') as mock_print:
-            repl._handle_help('help', [])
-        
-        call_args = str(mock_print.call_args_list)
-        assert "AVAILABLE COMMANDS" in call_args
-        assert "add <a> <b>" in call_args
-        assert "subtract <a> <b>" in call_args
-        assert "multiply <a> <b>" in call_args
-        assert "divide <a> <b>" in call_args
-        assert "power <a> <b>" in call_args
-        assert "modulus <a> <b>" in call_args
-        assert "root <a> <b>" in call_args
-        assert "int_divide <a> <b>" in call_args
-        assert "percent <a> <b>" in call_args
-        assert "abs_diff <a> <b>" in call_args
-        assert "history" in call_args
-        assert "clear" in call_args
-        assert "undo" in call_args
-        assert "redo" in call_args
-        assert "save" in call_args
-        assert "load" in call_args
-        assert "exit" in call_args
+        repl._handle_help('help', [])
+        output = capsys.readouterr().out
+        
+        assert "AVAILABLE COMMANDS" in output
+        assert "add <a> <b>" in output
+        assert "subtract <a> <b>" in output
+        assert "multiply <a> <b>" in output
+        assert "divide <a> <b>" in output
+        assert "power <a> <b>" in output
+        assert "modulus <a> <b>" in output
+        assert "root <a> <b>" in output
+        assert "int_divide <a> <b>" in output
+        assert "percent <a> <b>" in output
+        assert "abs_diff <a> <b>" in output
+        assert "history" in output
+        assert "clear" in output
+        assert "undo" in output
+        assert "redo" in output
+        assert "save" in output
+        assert "load" in output
+        assert "exit" in output
 
 
 class TestHandleExit:
     """Test exit handling"""
     
-    def test_handle_exit(self):
+    def test_handle_exit(self, calc, repl, capsys):
         """Test exiting REPL"""
-        calc = Mock(spec=Calculator)
-        repl = REPL(calc)
         repl.running = True
         
-        with patch('builtins.print') as mock_print:
-            repl._handle_exit('exit', [])
+        repl._handle_exit('exit', [])
+        output = capsys.readouterr().out
         
         assert repl.running is False
-        call_args = str(mock_print.call_args_list)
-        assert "Thank you" in call_args
-        assert "Goodbye" in call_args
+        calc.flush_auto_save.assert_called_once()
+        assert "Thank you" in output
+        assert "Goodbye" in output
 
 
 class TestGetLogger:
     """Test get_logger method"""
     
-    def test_get_logger_none(self):
+    def test_get_logger_none(self, repl):
         """Test get_logger when no logger exists"""
-        calc = Mock(spec=Calculator)
-        repl = REPL(calc)
-        
         logger = repl.get_logger()
         assert logger is None
     
-    def test_get_logger_exists(self):
+    def test_get_logger_exists(self, repl):
         """Test get_logger when logger exists"""
-        calc = Mock(spec=Calculator)
-        repl = REPL(calc)
         mock_logger = Mock()
         repl.logger = mock_logger
         
@@ -487,34 +445,30 @@ class TestGetLogger:
 class TestPrintWelcome:
     """Test print welcome method"""
     
-    def test_print_welcome(self):
+    def test_print_welcome(self, repl, capsys):
         """Test printing welcome message"""
-        calc = Mock(spec=Calculator)
-        repl = REPL(calc)
-        
-        with patch('builtins.print') as mock_print:
-            repl._print_welcome()
+        repl._print_welcome()
+        output = capsys.readouterr().out
         
-        call_args = str(mock_print.call_args_list)
-        assert "Welcome" in call_args
-        assert "Advanced Calculator" in call_args
-        assert "help" in call_args
+        assert "Welcome" in output
+        assert "Advanced Calculator" in output
+        assert "help" in output
 
 
 class TestAllOperations:
     """Test all operation commands are properly mapped"""
     
-    @pytest.mark.parametrize("operation", [
-        'add', 'subtract', 'multiply', 'divide', 'power', 
-        'modulus', 'root', 'int_divide', 'percent', 'abs_diff'
-    ])
-    def test_all_operations_mapped(self, operation):
-        """Test that all operations are properly handled"""
-        calc = Mock(spec=Calculator)
-        calc.calculate.return_value = 42
-        repl = REPL(calc)
-        
-        with patch('builtins.print'):
-            repl._handle_operation(operation, ['10', '5'])
-        
-        calc.calculate.assert_called_once_with(operation, 10.0, 5.0)
+    def test_repl_all_commands(self, calculator, repl_runner):
+        """Test every operation command in one REPL session"""
+        output = repl_runner(REPL(calculator), [
+            'add 5 3', 'subtract 10 3', 'multiply 4 5', 'divide 20 4',
+            'power 2 3', 'modulus 10 3', 'root 16 2', 'int_divide 10 3',
+            'percent 25 100', 'abs_diff 10 3', 'exit'
+        ])
+        
+        results = [line for line in output.splitlines() if line.startswith('Result: ')]
+        assert results == [
+            f"Result: {value}" for value in
+            (8.0, 7.0, 20.0, 5.0, 8.0, 1.0, 4.0, 3.0, 25.0, 7.0)
+        ]
+        assert calculator.get_history_count() == 10
@@ -4,7 +4,6 @@ Tests for calculator memento pattern
 import pytest
 from app.calculator_momento import CalculatorMemento, MementoCaretaker
 from app.calculation import Calculation
-from app.operations import AddOperation
 
 
 class TestCalculatorMemento:
@@ -12,30 +11,29 @@ class TestCalculatorMemento:
     
     def test_memento_creation(self):
         """Test creating a memento"""
-        calculations = [Calculation("add", 1, 2, 3)]
-        memento = CalculatorMemento(calculations)
+        calculation = Calculation("add", 1, 2, 3)
+        memento = CalculatorMemento(CalculatorMemento.ADD, (calculation, None))
         assert memento is not None
+        assert memento.op == "add"
     
     def test_memento_get_state(self):
-        """Test getting state from memento"""
+        """Test getting the change payload from memento"""
         calculations = [Calculation("add", 1, 2, 3), Calculation("subtract", 5, 3, 2)]
-        memento = CalculatorMemento(calculations)
+        memento = CalculatorMemento(CalculatorMemento.CLEAR, calculations)
         state = memento.get_state()
         
         assert len(state) == 2
         assert state[0].result == 3
         assert state[1].result == 2
     
-    def test_memento_state_is_copy(self):
-        """Test that memento state is a copy"""
-        original_calcs = [Calculation("add", 1, 2, 3)]
-        memento = CalculatorMemento(original_calcs)
-        
-        # Modify original
-        original_calcs.append(Calculation("multiply", 2, 3, 6))
-        
-        # Memento state should not be affected
-        assert len(memento.get_state()) == 1
+    def test_memento_stores_delta_without_copying(self):
+        """Test that memento keeps the change itself rather than a history copy"""
+        calculation = Calculation("add", 1, 2, 3)
+        memento = CalculatorMemento(CalculatorMemento.ADD, (calculation, None))
+        
+        stored, evicted = memento.get_state()
+        assert stored is calculation
+        assert evicted is None
 
 
 class TestMementoCaretaker:
@@ -50,8 +48,7 @@ class TestMementoCaretaker:
     def test_save_memento(self):
         """Test saving a memento"""
         caretaker = MementoCaretaker()
-        calculations = [Calculation("add", 1, 2, 3)]
-        memento = CalculatorMemento(calculations)
+        memento = CalculatorMemento(CalculatorMemento.ADD, (Calculation("add", 1, 2, 3), None))
         
         caretaker.save(memento)
         
@@ -62,8 +59,8 @@ class TestMementoCaretaker:
         """Test saving multiple mementos"""
         caretaker = MementoCaretaker()
         
-        memento1 = CalculatorMemento([Calculation("add", 1, 2, 3)])
-        memento2 = CalculatorMemento([Calculation("subtract", 5, 3, 2)])
+        memento1 = CalculatorMemento(CalculatorMemento.ADD, (Calculation("add", 1, 2, 3), None))
+        memento2 = CalculatorMemento(CalculatorMemento.ADD, (Calculation("subtract", 5, 3, 2), None))
         
         caretaker.save(memento1)
         caretaker.save(memento2)
@@ -75,16 +72,16 @@ class TestMementoCaretaker:
         """Test complete undo/redo workflow"""
         caretaker = MementoCaretaker()
         
-        memento1 = CalculatorMemento([Calculation("add", 1, 2, 3)])
-        memento2 = CalculatorMemento([Calculation("subtract", 5, 3, 2)])
+        memento1 = CalculatorMemento(CalculatorMemento.ADD, (Calculation("add", 1, 2, 3), None))
+        memento2 = CalculatorMemento(CalculatorMemento.ADD, (Calculation("subtract", 5, 3, 2), None))
         
         caretaker.save(memento1)
         caretaker.save(memento2)
         
-        # Test undo
+        # Test undo returns the change to revert
         assert caretaker.can_undo() == True
         undone = caretaker.undo()
-        assert undone == memento1
+        assert undone == memento2
         assert caretaker._current_index == 0
         
         # Test redo
@@ -111,9 +108,9 @@ class TestMementoCaretaker:
         """Test that saving after undo clears redo stack"""
         caretaker = MementoCaretaker()
         
-        memento1 = CalculatorMemento([Calculation("add", 1, 2, 3)])
-        memento2 = CalculatorMemento([Calculation("subtract", 5, 3, 2)])
-        memento3 = CalculatorMemento([Calculation("multiply", 2, 3, 6)])
+        memento1 = CalculatorMemento(CalculatorMemento.ADD, (Calculation("add", 1, 2, 3), None))
+        memento2 = CalculatorMemento(CalculatorMemento.ADD, (Calculation("subtract", 5, 3, 2), None))
+        memento3 = CalculatorMemento(CalculatorMemento.ADD, (Calculation("multiply", 2, 3, 6), None))
         
         caretaker.save(memento1)
         caretaker.save(memento2)
@@ -126,6 +123,23 @@ class TestMementoCaretaker:
         assert caretaker._current_index == 1
         assert caretaker.can_redo() == False
     
+    def test_caretaker_caps_memento_count(self):
+        """Test that the oldest mementos are dropped once max_depth is reached"""
+        caretaker = MementoCaretaker(max_depth=3)
+        mementos = [
+            CalculatorMemento(CalculatorMemento.ADD, (Calculation("add", i, 1, i + 1), None))
+            for i in range(5)
+        ]
+        
+        for memento in mementos:
+            caretaker.save(memento)
+        
+        assert list(caretaker._mementos) == mementos[2:]
+        assert caretaker._current_index == 2
+        assert caretaker.undo() is mementos[4]
+        assert caretaker.undo() is mementos[3]
+        assert caretaker.can_undo() == False
+    
     def test_can_undo_can_redo_edge_cases(self):
         """Test edge cases for can_undo and can_redo"""
         caretaker = MementoCaretaker()
@@ -135,14 +149,14 @@ class TestMementoCaretaker:
         assert caretaker.can_redo() == False
         
         # One memento
-        memento = CalculatorMemento([Calculation("add", 1, 2, 3)])
+        memento = CalculatorMemento(CalculatorMemento.ADD, (Calculation("add", 1, 2, 3), None))
         caretaker.save(memento)
         
         assert caretaker.can_undo() == False  # Only one state, can't undo to before initial
         assert caretaker.can_redo() == False
         
         # Two mementos
-        memento2 = CalculatorMemento([Calculation("subtract", 5, 3, 2)])
+        memento2 = CalculatorMemento(CalculatorMemento.ADD, (Calculation("subtract", 5, 3, 2), None))
         caretaker.save(memento2)
         
         assert caretaker.can_undo() == True
@@ -4,7 +4,8 @@ Tests for calculator configuration management - FIXED
 import pytest
 import os
 from pathlib import Path
-from app.calculator_config import CalculatorConfig
+from unittest.mock import patch
+from app.calculator_config import CalculatorConfig, config, get_config
 from app.exceptions import ConfigurationError
 
 
@@ -23,6 +24,15 @@ class TestCalculatorConfig:
         assert config.auto_save is True
         assert config.default_encoding == 'utf-8'
     
+    def test_config_defaults_in_clean_environment(self, monkeypatch, request):
+        """Test clean environment hides calculator settings from the config"""
+        monkeypatch.setenv("CALCULATOR_PRECISION", "3")
+        request.getfixturevalue("clean_environment")
+        
+        assert "CALCULATOR_PRECISION" not in os.environ
+        assert os.environ["CALCULATOR_TEST_MODE"] == "1"
+        assert CalculatorConfig().precision == 10
+    
     def test_config_load_from_env(self, monkeypatch):
         """Test config loads values from environment variables"""
         monkeypatch.setenv("CALCULATOR_LOG_DIR", "/tmp/logs")
@@ -128,22 +138,89 @@ class TestCalculatorConfig:
             CalculatorConfig()
     
     def test_config_zero_precision(self, monkeypatch):
-        """Test zero precision - FIXED"""
+        """Test zero precision is accepted (only negative values are rejected)"""
         monkeypatch.setenv("CALCULATOR_PRECISION", "0")
         
-        # Zero precision might be allowed in some implementations
-        # Check if it raises or just sets to minimum value
-        try:
-            config = CalculatorConfig()
-            # If it doesn't raise, check it's set to a valid value
-            assert config.precision >= 0
-        except ConfigurationError:
-            # This is also acceptable - zero precision is invalid
-            pass
+        assert CalculatorConfig().precision == 0
     
     def test_config_negative_max_input_value(self, monkeypatch):
         """Test negative max_input_value raises ConfigurationError"""
         monkeypatch.setenv("CALCULATOR_MAX_INPUT_VALUE", "-1000")
         
         with pytest.raises(ConfigurationError):
-            CalculatorConfig()
\ No newline at end of file
+            CalculatorConfig()
+    
+    def test_config_autosave_batch_size(self, monkeypatch):
+        """Test autosave batch size loads from environment"""
+        monkeypatch.setenv("CALCULATOR_AUTOSAVE_BATCH_SIZE", "8")
+        config = CalculatorConfig()
+        assert config.autosave_batch_size == 8
+    
+    def test_config_invalid_autosave_batch_size(self, monkeypatch):
+        """Test non-positive autosave batch size raises ConfigurationError"""
+        monkeypatch.setenv("CALCULATOR_AUTOSAVE_BATCH_SIZE", "0")
+        
+        with pytest.raises(ConfigurationError):
+            CalculatorConfig()
+    
+    def test_config_max_undo_depth(self, monkeypatch):
+        """Test max undo depth loads from environment"""
+        monkeypatch.setenv("CALCULATOR_MAX_UNDO_DEPTH", "25")
+        config = CalculatorConfig()
+        assert config.max_undo_depth == 25
+    
+    def test_config_invalid_max_undo_depth(self, monkeypatch):
+        """Test max undo depth below 2 raises ConfigurationError"""
+        monkeypatch.setenv("CALCULATOR_MAX_UNDO_DEPTH", "1")
+        
+        with pytest.raises(ConfigurationError):
+            CalculatorConfig()
+    
+    def test_config_skips_dotenv_when_already_loaded(self, monkeypatch):
+        """Test .env is not parsed again once the environment is marked loaded"""
+        monkeypatch.setenv("CALCULATOR_ENV_LOADED", "1")
+        
+        with patch("dotenv.load_dotenv") as mock_load:
+            CalculatorConfig()
+        
+        mock_load.assert_not_called()
+    
+    def test_config_loads_dotenv_once(self, monkeypatch):
+        """Test .env is parsed when the environment is not yet marked loaded"""
+        monkeypatch.delenv("CALCULATOR_ENV_LOADED", raising=False)
+        
+        with patch("dotenv.load_dotenv") as mock_load:
+            CalculatorConfig()
+        
+        mock_load.assert_called_once()
+        assert os.environ["CALCULATOR_ENV_LOADED"] == "1"
+    
+    def test_config_history_format(self, tmp_path, monkeypatch):
+        """Test history format selects the default history file suffix"""
+        monkeypatch.setenv("CALCULATOR_HISTORY_DIR", str(tmp_path))
+        monkeypatch.setenv("CALCULATOR_HISTORY_FORMAT", "Parquet")
+        config = CalculatorConfig()
+        assert config.history_format == "parquet"
+        assert config.history_file == tmp_path / "history.parquet"
+    
+    def test_config_invalid_history_format(self, monkeypatch):
+        """Test unsupported history format raises ConfigurationError"""
+        monkeypatch.setenv("CALCULATOR_HISTORY_FORMAT", "xlsx")
+        
+        with pytest.raises(ConfigurationError):
+            CalculatorConfig()
+    
+    def test_get_config_returns_shared_instance(self):
+        """Test get_config creates the global configuration only once"""
+        assert get_config() is get_config()
+        assert isinstance(get_config(), CalculatorConfig)
+    
+    def test_config_proxy_forwards_to_global_config(self):
+        """Test the module-level config reads and writes the global instance"""
+        original = get_config().precision
+        try:
+            config.precision = 3
+            assert get_config().precision == 3
+            assert config.precision == 3
+        finally:
+            config.precision = original
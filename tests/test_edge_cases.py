@@ -15,10 +15,9 @@ from app.operations import (
 from app.exceptions import OperationError
 
 
-class TestOperationsParameterized:
-    """Parameterized tests for all operations"""
-    
-    @pytest.mark.parametrize("a,b,expected", [
+# operation class -> (exact comparison?, [(a, b, expected), ...])
+_OPERATION_CASES = {
+    AddOperation: (False, [
         (0, 0, 0),
         (1, 1, 2),
         (-1, -1, -2),
@@ -26,56 +25,32 @@ class TestOperationsParameterized:
         (1000000, 1000000, 2000000),
         (-5, 5, 0),
         (0.1, 0.2, 0.3),
-    ])
-    def test_add_parameterized(self, a, b, expected):
-        """Parameterized test for addition"""
-        op = AddOperation()
-        result = op.execute(a, b)
-        assert pytest.approx(result, 0.0001) == expected
-    
-    @pytest.mark.parametrize("a,b,expected", [
+    ]),
+    SubtractOperation: (False, [
         (5, 3, 2),
         (0, 0, 0),
         (-5, -3, -2),
         (3, 5, -2),
         (10.5, 5.5, 5.0),
         (1000000, 1, 999999),
-    ])
-    def test_subtract_parameterized(self, a, b, expected):
-        """Parameterized test for subtraction"""
-        op = SubtractOperation()
-        result = op.execute(a, b)
-        assert pytest.approx(result, 0.0001) == expected
-    
-    @pytest.mark.parametrize("a,b,expected", [
+    ]),
+    MultiplyOperation: (False, [
         (5, 3, 15),
         (0, 100, 0),
         (-5, 3, -15),
         (-5, -3, 15),
         (0.5, 0.5, 0.25),
         (1000, 1000, 1000000),
-    ])
-    def test_multiply_parameterized(self, a, b, expected):
-        """Parameterized test for multiplication"""
-        op = MultiplyOperation()
-        result = op.execute(a, b)
-        assert pytest.approx(result, 0.0001) == expected
-    
-    @pytest.mark.parametrize("a,b,expected", [
+    ]),
+    DivideOperation: (False, [
         (10, 2, 5.0),
         (10, 3, 3.333333),
         (0, 5, 0.0),
         (-10, 2, -5.0),
         (7, 7, 1.0),
         (1, 8, 0.125),
-    ])
-    def test_divide_parameterized(self, a, b, expected):
-        """Parameterized test for division"""
-        op = DivideOperation()
-        result = op.execute(a, b)
-        assert pytest.approx(result, 0.0001) == expected
-    
-    @pytest.mark.parametrize("base,exp,expected", [
+    ]),
+    PowerOperation: (False, [
         (2, 0, 1),
         (2, 1, 2),
         (2, 3, 8),
@@ -85,316 +60,206 @@ class TestOperationsParameterized:
         (1, 1000, 1),
         (-2, 2, 4),
         (-2, 3, -8),
-    ])
-    def test_power_parameterized(self, base, exp, expected):
-        """Parameterized test for power"""
-        op = PowerOperation()
-        result = op.execute(base, exp)
-        assert pytest.approx(result, 0.0001) == expected
-    
-    @pytest.mark.parametrize("a,b,expected", [
+    ]),
+    ModulusOperation: (True, [
         (10, 3, 1),
         (10, 5, 0),
         (7, 3, 1),
         (100, 7, 2),
         (5, 10, 5),
-    ])
-    def test_modulus_parameterized(self, a, b, expected):
-        """Parameterized test for modulus"""
-        op = ModulusOperation()
-        result = op.execute(a, b)
-        assert result == expected
-    
-    @pytest.mark.parametrize("a,b,expected", [
+    ]),
+    IntegerDivideOperation: (True, [
         (10, 3, 3),
         (10, 5, 2),
         (7, 3, 2),
         (100, 7, 14),
         (5, 10, 0),
         (-10, 3, -4),
-    ])
-    def test_int_divide_parameterized(self, a, b, expected):
-        """Parameterized test for integer division"""
-        op = IntegerDivideOperation()
-        result = op.execute(a, b)
-        assert result == expected
-    
-    @pytest.mark.parametrize("a,b,expected", [
+    ]),
+    PercentageOperation: (False, [
         (25, 100, 25.0),
         (50, 200, 25.0),
         (100, 100, 100.0),
         (1, 1000, 0.1),
         (200, 100, 200.0),
-    ])
-    def test_percent_parameterized(self, a, b, expected):
-        """Parameterized test for percentage"""
-        op = PercentageOperation()
-        result = op.execute(a, b)
-        assert pytest.approx(result, 0.0001) == expected
-    
-    @pytest.mark.parametrize("a,b,expected", [
+    ]),
+    AbsoluteDifferenceOperation: (True, [
         (10, 3, 7),
         (3, 10, 7),
         (5, 5, 0),
         (-5, -10, 5),
         (5, -3, 8),
         (0, 5, 5),
+    ]),
+}
+
+
+class TestOperationsParameterized:
+    """Parameterized tests for all operations"""
+    
+    @pytest.mark.parametrize("operation_class,a,b,expected,exact", [
+        pytest.param(cls, a, b, expected, exact, id=f"{cls.__name__}-{a}-{b}")
+        for cls, (exact, cases) in _OPERATION_CASES.items()
+        for a, b, expected in cases
     ])
-    def test_abs_diff_parameterized(self, a, b, expected):
-        """Parameterized test for absolute difference"""
-        op = AbsoluteDifferenceOperation()
-        result = op.execute(a, b)
-        assert result == expected
+    def test_operation_parameterized(self, operation_class, a, b, expected, exact):
+        """Parameterized test for every operation"""
+        result = operation_class().execute(a, b)
+        if exact:
+            assert result == expected
+        else:
+            assert math.isclose(result, expected, rel_tol=0.0001)
 
 
 class TestEdgeCases:
     """Test edge cases and boundary conditions"""
     
-    def test_very_small_numbers(self):
-        """Test operations with very small numbers"""
-        calc = Calculator()
-        result = calc.calculate("add", 0.0001, 0.0001)
-        assert pytest.approx(result, 0.00001) == 0.0002
-    
-    def test_very_large_numbers(self):
-        """Test operations with very large numbers"""
-        calc = Calculator()
-        result = calc.calculate("add", 1e15, 1e15)
-        assert result == 2e15
+    @pytest.mark.parametrize("operation,a,b,expected", [
+        pytest.param("add", 1e15, 1e15, 2e15, id="very_large_numbers"),
+        pytest.param("add", -0.0, 0.0, 0.0, id="negative_zero"),
+        pytest.param("power", 2, 10, 1024, id="power_with_large_exponent"),
+        pytest.param("percent", 150, 100, 150.0, id="percentage_over_100"),
+        pytest.param("abs_diff", 42, 42, 0, id="absolute_difference_with_same_number"),
+        # Python returns 1 for 0^0
+        pytest.param("power", 0, 0, 1, id="zero_to_zero_power"),
+    ])
+    def test_exact_edge_results(self, calculator, operation, a, b, expected):
+        """Test edge-case inputs whose results are exact"""
+        assert calculator.calculate(operation, a, b) == expected
     
-    def test_negative_zero(self):
-        """Test operations with negative zero"""
-        calc = Calculator()
-        result = calc.calculate("add", -0.0, 0.0)
-        assert result == 0.0
+    @pytest.mark.parametrize("operation,a,b,expected,rel_tol", [
+        pytest.param("add", 0.0001, 0.0001, 0.0002, 0.00001, id="very_small_numbers"),
+        # Known floating point issue
+        pytest.param("add", 0.1, 0.2, 0.3, 0.0001, id="precision_limits"),
+        pytest.param("root", 0.0001, 2, 0.01, 0.0001, id="root_of_very_small_number"),
+        pytest.param("modulus", 10.5, 3.0, 1.5, 0.001, id="modulus_with_decimals"),
+        pytest.param("divide", 1, 3, 0.3333, 0.0001, id="repeating_decimal"),
+        pytest.param("multiply", 3.14159265359, 2, 6.2832, 0.0001, id="operations_with_pi"),
+        pytest.param("power", 2.71828182846, 2, 7.389, 0.001, id="operations_with_e"),
+        pytest.param("root", 17, 2, 4.1231, 0.0001, id="square_root_of_prime"),
+        pytest.param("root", -27, 3, -3.0, 0.0001, id="cube_root_of_negative"),
+        pytest.param("power", 16, 0.5, 4.0, 0.0001, id="fractional_powers"),
+        pytest.param("power", 4, -0.5, 0.5, 0.0001, id="negative_fractional_powers"),
+    ])
+    def test_approximate_edge_results(self, calculator, operation, a, b, expected, rel_tol):
+        """Test edge-case inputs whose results are only close to the expected value"""
+        assert math.isclose(calculator.calculate(operation, a, b), expected, rel_tol=rel_tol)
     
-    def test_infinity_behavior(self):
+    def test_infinity_behavior(self, calculator):
         """Test behavior approaching infinity"""
-        calc = Calculator()
-        result = calc.calculate("divide", 1, 0.0000001)
+        result = calculator.calculate("divide", 1, 0.0000001)
         assert result > 1000000
     
-    def test_precision_limits(self):
-        """Test floating point precision limits"""
-        calc = Calculator()
-        result = calc.calculate("add", 0.1, 0.2)
-        # Known floating point issue
-        assert pytest.approx(result, 0.0001) == 0.3
-    
-    def test_repeated_operations(self):
+    def test_repeated_operations(self, calculator):
         """Test repeated operations maintain accuracy"""
-        calc = Calculator()
         result = 0
         for _ in range(100):  # Reduced from 1000
-            result = calc.calculate("add", result, 1)
+            result = calculator.calculate("add", result, 1)
         assert result == 100
     
-    def test_alternating_operations(self):
+    def test_alternating_operations(self, calculator):
         """Test alternating add and subtract"""
-        calc = Calculator()
         result = 100
         for _ in range(50):
-            result = calc.calculate("add", result, 10)
-            result = calc.calculate("subtract", result, 10)
+            result = calculator.calculate("add", result, 10)
+            result = calculator.calculate("subtract", result, 10)
         assert result == 100
-    
-    def test_root_of_very_small_number(self):
-        """Test root of very small number"""
-        calc = Calculator()
-        result = calc.calculate("root", 0.0001, 2)
-        assert pytest.approx(result, 0.0001) == 0.01
-    
-    def test_power_with_large_exponent(self):
-        """Test power with large exponent"""
-        calc = Calculator()
-        result = calc.calculate("power", 2, 10)
-        assert result == 1024
-    
-    def test_modulus_with_decimals(self):
-        """Test modulus with decimal numbers"""
-        calc = Calculator()
-        result = calc.calculate("modulus", 10.5, 3.0)
-        assert pytest.approx(result, 0.001) == 1.5
-    
-    def test_division_resulting_in_repeating_decimal(self):
-        """Test division that results in repeating decimal"""
-        calc = Calculator()
-        result = calc.calculate("divide", 1, 3)
-        assert pytest.approx(result, 0.0001) == 0.3333
-    
-    def test_percentage_over_100(self):
-        """Test percentage calculation over 100%"""
-        calc = Calculator()
-        result = calc.calculate("percent", 150, 100)
-        assert result == 150.0
-    
-    def test_absolute_difference_with_same_number(self):
-        """Test absolute difference of same numbers"""
-        calc = Calculator()
-        result = calc.calculate("abs_diff", 42, 42)
-        assert result == 0
-    
-    def test_operations_with_pi(self):
-        """Test operations with pi approximation"""
-        calc = Calculator()
-        pi = 3.14159265359
-        result = calc.calculate("multiply", pi, 2)
-        assert pytest.approx(result, 0.0001) == 6.2832
-    
-    def test_operations_with_e(self):
-        """Test operations with e approximation"""
-        calc = Calculator()
-        e = 2.71828182846
-        result = calc.calculate("power", e, 2)
-        assert pytest.approx(result, 0.001) == 7.389
-    
-    def test_square_root_of_prime(self):
-        """Test square root of prime number"""
-        calc = Calculator()
-        result = calc.calculate("root", 17, 2)
-        assert pytest.approx(result, 0.0001) == 4.1231
-    
-    def test_cube_root_of_negative(self):
-        """Test cube root of negative number"""
-        calc = Calculator()
-        result = calc.calculate("root", -27, 3)
-        assert pytest.approx(result, 0.0001) == -3.0
-    
-    def test_fractional_powers(self):
-        """Test fractional powers (roots)"""
-        calc = Calculator()
-        result = calc.calculate("power", 16, 0.5)
-        assert pytest.approx(result, 0.0001) == 4.0
-    
-    def test_negative_fractional_powers(self):
-        """Test negative fractional powers"""
-        calc = Calculator()
-        result = calc.calculate("power", 4, -0.5)
-        assert pytest.approx(result, 0.0001) == 0.5
-    
-    def test_zero_to_zero_power(self):
-        """Test 0^0 (mathematical edge case)"""
-        calc = Calculator()
-        result = calc.calculate("power", 0, 0)
-        # Python returns 1 for 0^0
-        assert result == 1
 
 
 class TestErrorConditionsParameterized:
     """Parameterized tests for error conditions"""
     
     @pytest.mark.parametrize("divisor", [0, 0.0, -0.0])
-    def test_divide_by_zero_variations(self, divisor):
+    def test_divide_by_zero_variations(self, divisor, calculator):
         """Test division by zero with various zero representations"""
-        calc = Calculator()
         with pytest.raises(OperationError):
-            calc.calculate("divide", 10, divisor)
+            calculator.calculate("divide", 10, divisor)
     
     @pytest.mark.parametrize("divisor", [0, 0.0, -0.0])
-    def test_modulus_by_zero_variations(self, divisor):
+    def test_modulus_by_zero_variations(self, divisor, calculator):
         """Test modulus by zero with various zero representations"""
-        calc = Calculator()
         with pytest.raises(OperationError):
-            calc.calculate("modulus", 10, divisor)
+            calculator.calculate("modulus", 10, divisor)
     
     @pytest.mark.parametrize("divisor", [0, 0.0, -0.0])
-    def test_int_divide_by_zero_variations(self, divisor):
+    def test_int_divide_by_zero_variations(self, divisor, calculator):
         """Test integer division by zero"""
-        calc = Calculator()
         with pytest.raises(OperationError):
-            calc.calculate("int_divide", 10, divisor)
+            calculator.calculate("int_divide", 10, divisor)
     
     @pytest.mark.parametrize("base,root", [
         (-16, 2),
         (-100, 4),
         (-25, 6),
     ])
-    def test_even_root_of_negative(self, base, root):
+    def test_even_root_of_negative(self, base, root, calculator):
         """Test even root of negative number raises error"""
-        calc = Calculator()
         with pytest.raises(OperationError):
-            calc.calculate("root", base, root)
+            calculator.calculate("root", base, root)
     
     @pytest.mark.parametrize("degree", [0, 0.0, -1, -2])
-    def test_root_invalid_degree(self, degree):
+    def test_root_invalid_degree(self, degree, calculator):
         """Test root with invalid degree"""
-        calc = Calculator()
         with pytest.raises(OperationError):
-            calc.calculate("root", 16, degree)
+            calculator.calculate("root", 16, degree)
     
     @pytest.mark.parametrize("denominator", [0, 0.0, -0.0])
-    def test_percentage_zero_denominator(self, denominator):
+    def test_percentage_zero_denominator(self, denominator, calculator):
         """Test percentage with zero denominator"""
-        calc = Calculator()
         with pytest.raises(OperationError):
-            calc.calculate("percent", 50, denominator)
+            calculator.calculate("percent", 50, denominator)
 
 
 class TestCalculatorStateManagement:
     """Tests for calculator state management - FIXED"""
     
-    def test_history_maintains_order_after_undo_redo(self):
+    def test_history_maintains_order_after_undo_redo(self, calculator):
         """Test history order is maintained after undo/redo"""
-        calc = Calculator()
+        calculator.calculate_many([("add", 1, 1), ("add", 2, 2), ("add", 3, 3)])
         
-        calc.calculate("add", 1, 1)  # Result: 2
-        calc.calculate("add", 2, 2)  # Result: 4
-        calc.calculate("add", 3, 3)  # Result: 6
+        calculator.undo()
+        calculator.redo()
         
-        calc.undo()
-        calc.redo()
-        
-        history = calc.get_history()
-        # Use .result attribute directly, not .get_result()
-        assert history[0].result == 2
-        assert history[1].result == 4
-        assert history[2].result == 6
+        results = tuple(calc.result for calc in calculator.get_history())
+        assert results == (2, 4, 6)
     
-    def test_multiple_undo_redo_cycles(self):
+    def test_multiple_undo_redo_cycles(self, calculator):
         """Test multiple undo/redo cycles maintain consistency"""
-        calc = Calculator()
-        
-        calc.calculate("add", 5, 5)
-        calc.calculate("add", 10, 10)
-        calc.calculate("add", 15, 15)
+        calculator.calculate("add", 5, 5)
+        calculator.calculate("add", 10, 10)
+        calculator.calculate("add", 15, 15)
         
         # Cycle 1
-        calc.undo()
-        calc.redo()
-        assert len(calc.get_history()) == 3
+        calculator.undo()
+        calculator.redo()
+        assert calculator.get_history_count() == 3
         
         # Cycle 2
-        calc.undo()
-        calc.undo()
-        calc.redo()
-        assert len(calc.get_history()) == 2
+        calculator.undo()
+        calculator.undo()
+        calculator.redo()
+        assert calculator.get_history_count() == 2
     
-    def test_state_after_failed_operation(self):
+    def test_state_after_failed_operation(self, calculator):
         """Test calculator state is unchanged after failed operation"""
-        calc = Calculator()
+        calculator.calculate("add", 5, 3)
+        initial_count = calculator.get_history_count()
         
-        calc.calculate("add", 5, 3)
-        initial_count = len(calc.get_history())
-        
-        try:
-            calc.calculate("divide", 10, 0)
-        except OperationError:
-            pass
+        with pytest.raises(OperationError):
+            calculator.calculate("divide", 10, 0)
         
-        assert len(calc.get_history()) == initial_count
+        assert calculator.get_history_count() == initial_count
     
-    def test_concurrent_observer_notifications(self):
+    def test_concurrent_observer_notifications(self, calculator):
         """Test multiple observers receive notifications - FIXED"""
-        calc = Calculator()
-        
         # Use correct method name: register_observer
         mock_obs1 = Mock()
         mock_obs2 = Mock()
         
-        calc.register_observer(mock_obs1)
-        calc.register_observer(mock_obs2)
+        calculator.register_observer(mock_obs1)
+        calculator.register_observer(mock_obs2)
         
-        calc.calculate("add", 5, 3)
+        calculator.calculate("add", 5, 3)
         
         # Both observers should be notified
         assert mock_obs1.update.called
@@ -407,109 +272,95 @@ class TestBoundaryValues:
     @pytest.mark.parametrize("value", [
         1e-10,  # Use larger values that won't round to zero
     ])
-    def test_very_small_positive_values(self, value):
+    def test_very_small_positive_values(self, value, calculator):
         """Test operations with very small positive values"""
-        calc = Calculator()
-        result = calc.calculate("add", value, value)
+        result = calculator.calculate("add", value, value)
         # Very small values may round, so just check it doesn't error
         assert result >= 0
     
     @pytest.mark.parametrize("value", [
         1e10, 1e15
     ])
-    def test_very_large_positive_values(self, value):
+    def test_very_large_positive_values(self, value, calculator):
         """Test operations with very large positive values"""
-        calc = Calculator()
-        result = calc.calculate("add", value, value)
+        result = calculator.calculate("add", value, value)
         assert result == 2 * value
     
-    def test_operations_near_max_float(self):
+    def test_operations_near_max_float(self, calculator):
         """Test operations near maximum float value - FIXED"""
-        calc = Calculator()
         large = 1e100  # Use a smaller large number
-        result = calc.calculate("add", large, 1)
+        result = calculator.calculate("add", large, 1)
         assert result >= large  # Allow for rounding
     
-    def test_operations_near_min_float(self):
+    def test_operations_near_min_float(self, calculator):
         """Test operations near minimum positive float value - FIXED"""
-        calc = Calculator()
         small = 1e-10  # Use a larger small number
-        result = calc.calculate("multiply", small, 2)
+        result = calculator.calculate("multiply", small, 2)
         assert result >= small or result == 0  # Allow for underflow
 
 
 class TestSpecialMathematicalCases:
     """Tests for special mathematical cases - FIXED"""
     
-    def test_golden_ratio_calculation(self):
+    def test_golden_ratio_calculation(self, calculator):
         """Test calculation involving golden ratio"""
-        calc = Calculator()
         # phi ≈ 1.618
-        sqrt5 = calc.calculate("root", 5, 2)
-        result = calc.calculate("divide", calc.calculate("add", 1, sqrt5), 2)
-        assert pytest.approx(result, 0.001) == 1.618
+        sqrt5 = calculator.calculate("root", 5, 2)
+        result = calculator.calculate("divide", calculator.calculate("add", 1, sqrt5), 2)
+        assert math.isclose(result, 1.618, rel_tol=0.001)
     
-    def test_pythagorean_triple(self):
+    def test_pythagorean_triple(self, calculator):
         """Test Pythagorean triple calculation (3,4,5)"""
-        calc = Calculator()
-        a_squared = calc.calculate("power", 3, 2)  # 9
-        b_squared = calc.calculate("power", 4, 2)  # 16
-        c_squared = calc.calculate("add", a_squared, b_squared)  # 25
-        c = calc.calculate("root", c_squared, 2)  # 5
+        a_squared = calculator.calculate("power", 3, 2)  # 9
+        b_squared = calculator.calculate("power", 4, 2)  # 16
+        c_squared = calculator.calculate("add", a_squared, b_squared)  # 25
+        c = calculator.calculate("root", c_squared, 2)  # 5
         assert c == 5.0
     
-    def test_factorial_approximation_via_multiplication(self):
+    def test_factorial_approximation_via_multiplication(self, calculator):
         """Test factorial-like calculation using multiplication"""
-        calc = Calculator()
         result = 1
         for i in range(1, 6):
-            result = calc.calculate("multiply", result, i)
+            result = calculator.calculate("multiply", result, i)
         assert result == 120  # 5!
     
-    def test_percentage_composition(self):
+    def test_percentage_composition(self, calculator):
         """Test percentage of percentage calculation - FIXED"""
-        calc = Calculator()
         # 20% of 50 = 10
-        first = calc.calculate("percent", 20, 100)  # 20% as value = 20
-        second = calc.calculate("multiply", first, 0.5)  # 20 * 0.5 = 10
+        first = calculator.calculate("percent", 20, 100)  # 20% as value = 20
+        second = calculator.calculate("multiply", first, 0.5)  # 20 * 0.5 = 10
         assert second == 10.0
     
-    def test_compound_operations(self):
+    def test_compound_operations(self, calculator):
         """Test compound mathematical operations"""
-        calc = Calculator()
         # Calculate (5 + 3) * (10 - 2)
-        sum_result = calc.calculate("add", 5, 3)  # 8
-        diff_result = calc.calculate("subtract", 10, 2)  # 8
-        final = calc.calculate("multiply", sum_result, diff_result)  # 64
+        sum_result = calculator.calculate("add", 5, 3)  # 8
+        diff_result = calculator.calculate("subtract", 10, 2)  # 8
+        final = calculator.calculate("multiply", sum_result, diff_result)  # 64
         assert final == 64
 
 
 class TestHistoryManagement:
     """Tests for history management edge cases - FIXED"""
     
-    def test_history_with_max_size_limit(self):
+    def test_history_with_max_size_limit(self, calculator):
         """Test history respects maximum size limit"""
-        calc = Calculator()
-        
         # Add many calculations
         for i in range(100):  # Reduced from 150
-            calc.calculate("add", i, 1)
+            calculator.calculate("add", i, 1)
         
         # Should have calculations (limited by config)
-        history = calc.get_history()
+        history = calculator.get_history()
         assert len(history) == 100
     
-    def test_history_after_clear_and_new_calculations(self):
+    def test_history_after_clear_and_new_calculations(self, calculator_with_two):
         """Test history works correctly after clear - FIXED"""
-        calc = Calculator()
-        
-        calc.calculate("add", 5, 3)
-        calc.calculate("subtract", 10, 2)
-        calc.clear_history()
+        calculator = calculator_with_two
+        calculator.clear_history()
         
-        calc.calculate("multiply", 4, 5)
+        calculator.calculate("multiply", 4, 5)
         
-        history = calc.get_history()
+        history = calculator.get_history()
         assert len(history) == 1
         # Use .result attribute directly
         assert history[0].result == 20
@@ -518,50 +369,43 @@ class TestHistoryManagement:
 class TestDataPersistence:
     """Tests for data persistence edge cases - FIXED"""
     
-    def test_save_and_load_with_special_characters(self, tmp_path):
+    def test_save_and_load_with_special_characters(self, tmp_path, calculator):
         """Test save/load with file path containing special characters"""
-        calc = Calculator()
         history_file = tmp_path / "test-history_2024.csv"
         
-        calc.calculate("add", 5, 3)
-        calc.save_history(str(history_file))
+        calculator.calculate("add", 5, 3)
+        calculator.save_history(str(history_file))
         
         calc2 = Calculator()
         calc2.load_history(str(history_file))
         
         assert len(calc2.get_history()) == 1
     
-    def test_save_overwrites_existing_file(self, tmp_path):
+    def test_save_overwrites_existing_file(self, temp_history_file, calculator):
         """Test saving overwrites existing history file - FIXED"""
-        calc = Calculator()
-        history_file = tmp_path / "history.csv"
-        
         # First save
-        calc.calculate("add", 5, 3)
-        calc.save_history(str(history_file))
+        calculator.calculate("add", 5, 3)
+        calculator.save_history(str(temp_history_file))
         
         # Clear and save again
-        calc.clear_history()
-        calc.calculate("multiply", 4, 5)
-        calc.save_history(str(history_file))
+        calculator.clear_history()
+        calculator.calculate("multiply", 4, 5)
+        calculator.save_history(str(temp_history_file))
         
         # Load should have only new calculation
         calc2 = Calculator()
-        calc2.load_history(str(history_file))
+        calc2.load_history(str(temp_history_file))
         assert len(calc2.get_history()) == 1
         # Use .result attribute directly
         assert calc2.get_history()[0].result == 20
     
-    def test_load_preserves_calculation_metadata(self, tmp_path):
+    def test_load_preserves_calculation_metadata(self, temp_history_file, calculator):
         """Test that loading preserves all calculation metadata - FIXED"""
-        calc = Calculator()
-        history_file = tmp_path / "history.csv"
-        
-        calc.calculate("add", 5, 3)
-        calc.save_history(str(history_file))
+        calculator.calculate("add", 5, 3)
+        calculator.save_history(str(temp_history_file))
         
         calc2 = Calculator()
-        calc2.load_history(str(history_file))
+        calc2.load_history(str(temp_history_file))
         
         loaded_calc = calc2.get_history()[0]
         # Use .result attribute directly
@@ -574,79 +418,59 @@ class TestDataPersistence:
 class TestPerformance:
     """Tests for performance and scalability - FIXED"""
     
-    def test_many_calculations_performance(self):
+    def test_many_calculations_performance(self, calculator):
         """Test calculator handles many calculations"""
-        calc = Calculator()
-        
         # Add 100 calculations (config max is 100)
         for i in range(100):
-            calc.calculate("add", i, 1)
+            calculator.calculate("add", i, 1)
         
         # Should have max 100 (due to config limit)
-        assert len(calc.get_history()) == 100
+        assert calculator.get_history_count() == 100
     
-    def test_large_undo_stack(self):
+    def test_large_undo_stack(self, calculator):
         """Test undo with large history"""
-        calc = Calculator()
-        
         for i in range(100):
-            calc.calculate("add", i, 1)
+            calculator.calculate("add", i, 1)
         
         for _ in range(50):
-            calc.undo()
+            calculator.undo()
         
-        assert len(calc.get_history()) == 50
+        assert calculator.get_history_count() == 50
     
-    def test_alternating_undo_redo_performance(self):
+    def test_alternating_undo_redo_performance(self, calculator_with_two):
         """Test alternating undo/redo operations"""
-        calc = Calculator()
-        
-        calc.calculate("add", 5, 3)
-        calc.calculate("subtract", 10, 2)
-        
         for _ in range(10):  # Reduced from 100
-            calc.undo()
-            calc.redo()
+            calculator_with_two.undo()
+            calculator_with_two.redo()
         
-        assert len(calc.get_history()) == 2
+        assert calculator_with_two.get_history_count() == 2
 
 
 class TestRobustness:
     """Tests for robustness and error recovery - FIXED"""
     
-    def test_calculator_recovers_from_multiple_errors(self):
+    def test_calculator_recovers_from_multiple_errors(self, calculator):
         """Test calculator continues working after multiple errors"""
-        calc = Calculator()
-        
-        errors = 0
         for _ in range(5):
-            try:
-                calc.calculate("divide", 10, 0)
-            except OperationError:
-                errors += 1
-        
-        assert errors == 5
+            with pytest.raises(OperationError):
+                calculator.calculate("divide", 10, 0)
         
         # Calculator should still work
-        result = calc.calculate("add", 5, 3)
+        result = calculator.calculate("add", 5, 3)
         assert result == 8
     
-    def test_undo_redo_after_errors(self):
+    def test_undo_redo_after_errors(self, calculator):
         """Test undo/redo work after operation errors"""
-        calc = Calculator()
-        
-        calc.calculate("add", 5, 3)
+        calculator.calculate("add", 5, 3)
         
-        try:
-            calc.calculate("divide", 10, 0)
-        except OperationError:
-            pass
+        with pytest.raises(OperationError):
+            calculator.calculate("divide", 10, 0)
         
-        calc.calculate("multiply", 4, 5)
+        calculator.calculate("multiply", 4, 5)
         
         # Should be able to undo valid calculations
-        calc.undo()
-        assert len(calc.get_history()) == 1
+        calculator.undo()
+        assert calculator.get_history_count() == 1
     
     def test_observer_error_doesnt_break_calculator(self):
         """Test calculator continues if observer fails - FIXED"""
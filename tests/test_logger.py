@@ -5,10 +5,23 @@ import pytest
 import logging
 import tempfile
 import os
+import threading
+import time
 from pathlib import Path
 from unittest.mock import Mock, patch
 from app.logger import Logger
 
+# Log path handed to a mocked config; never written to
+_DUMMY_LOG = Path("/tmp/test.log")
+
+
+@pytest.fixture
+def real_handlers(monkeypatch):
+    """Let a fresh_logger test build its real handlers instead of the NullHandler"""
+    monkeypatch.delenv('CALCULATOR_TEST_MODE', raising=False)
+    yield
+    Logger.shutdown()
+
 
 class TestLogger:
     """Test cases for Logger class"""
@@ -35,7 +48,7 @@ class TestLogger:
     def test_logger_methods(self, mock_config):
         """Test all logger methods"""
         # Mock config
-        mock_config.log_file = Path("/tmp/test.log")
+        mock_config.log_file = _DUMMY_LOG
         mock_config.default_encoding = 'utf-8'
         
         logger = Logger()
@@ -55,6 +68,7 @@ class TestLogger:
         # Should not raise exception
         logger.log_calculation(calc)
     
+    @pytest.mark.fresh_logger
     def test_logger_with_temp_file(self):
         """Test logger with temporary file"""
         with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False) as temp_file:
@@ -66,8 +80,7 @@ class TestLogger:
                 mock_config.log_file = temp_path
                 mock_config.default_encoding = 'utf-8'
                 
-                # Reinitialize logger to use temp file
-                Logger._instance = None  # Reset singleton
+                # The fresh_logger marker makes this build a new logger
                 logger = Logger()
                 
                 # Log a message
@@ -81,5 +94,186 @@ class TestLogger:
             # Clean up
             if temp_path.exists():
                 os.unlink(temp_path)
-            # Reset singleton for other tests
-            Logger._instance = None
\ No newline at end of file
+    
+    @pytest.mark.fresh_logger
+    def test_logger_singleton_across_threads(self):
+        """Test concurrent first construction builds exactly one logger"""
+        calls = []
+        barrier = threading.Barrier(8)
+        instances = []
+        original = Logger._initialize_logger
+        
+        def slow_initialize(self):
+            calls.append(self)
+            time.sleep(0.01)
+            original(self)
+        
+        def build():
+            barrier.wait()
+            instances.append(Logger())
+        
+        with patch.object(Logger, '_initialize_logger', slow_initialize):
+            threads = [threading.Thread(target=build) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        
+        assert len(calls) == 1
+        assert all(instance is instances[0] for instance in instances)
+    
+    def test_logger_reuses_handlers(self):
+        """Test constructing the singleton again does not rebuild handlers"""
+        logger = Logger()
+        handlers = list(logger.logger.handlers)
+        
+        Logger()
+        
+        assert logger.logger.handlers == handlers
+    
+    @pytest.mark.fresh_logger
+    def test_handlers_share_formatter(self, real_handlers):
+        """Test all handlers use the module-level formatter"""
+        from app.logger import _FORMATTER
+        
+        Logger()
+        
+        handlers = [getattr(h, 'target', h) for h in Logger._listener.handlers]
+        assert all(h.formatter is _FORMATTER for h in handlers)
+    
+    @pytest.mark.fresh_logger
+    def test_records_are_written_by_queue_listener(self, real_handlers, tmp_path):
+        """Test the logger enqueues records and the listener writes them"""
+        from logging.handlers import QueueHandler
+        
+        log_file = tmp_path / "queued.log"
+        with patch('app.logger.config') as mock_config:
+            mock_config.log_file = log_file
+            mock_config.default_encoding = 'utf-8'
+            logger = Logger()
+        
+        assert [isinstance(h, QueueHandler) for h in logger.logger.handlers] == [True]
+        logger.info("Queued message")
+        
+        # Stopping the listener drains the queue to the file
+        Logger.shutdown()
+        assert "Queued message" in log_file.read_text()
+    
+    @pytest.mark.fresh_logger
+    def test_records_are_formatted_on_listener_thread(self, real_handlers, tmp_path, monkeypatch):
+        """Test only accepted records are formatted, and not during the log call"""
+        formatted = []
+        
+        class Probe:
+            def __str__(self):
+                formatted.append(self)
+                return "probe"
+        
+        with patch('app.logger.config') as mock_config:
+            mock_config.log_file = tmp_path / "deferred.log"
+            mock_config.default_encoding = 'utf-8'
+            logger = Logger()
+        # Keep pytest's own root handlers from formatting the records
+        monkeypatch.setattr(logger.logger, 'propagate', False)
+        
+        logger.debug("Dropped %s", Probe())
+        kept = Probe()
+        logger.info("Kept %s", kept)
+        # INFO records wait unformatted in the file buffer until it flushes
+        assert formatted == []
+        
+        Logger.shutdown()
+        assert formatted == [kept]
+    
+    @pytest.mark.fresh_logger
+    def test_file_records_are_buffered_until_warning(self, real_handlers, tmp_path):
+        """Test INFO records are held back and a WARNING flushes them to disk"""
+        log_file = tmp_path / "buffered.log"
+        with patch('app.logger.config') as mock_config:
+            mock_config.log_file = log_file
+            mock_config.default_encoding = 'utf-8'
+            logger = Logger()
+        listener = Logger._listener
+        
+        # Restarting the listener waits until the queue is drained
+        logger.info("Buffered message")
+        listener.stop()
+        listener.start()
+        # The file is opened lazily, so nothing has created it yet
+        assert not log_file.exists()
+        
+        logger.warning("Flushing message")
+        listener.stop()
+        listener.start()
+        contents = log_file.read_text()
+        assert "Buffered message" in contents
+        assert "Flushing message" in contents
+    
+    @pytest.mark.fresh_logger
+    def test_reinitialize_reuses_file_handler(self, real_handlers, tmp_path):
+        """Test reinitializing for the same log file keeps the open file handler"""
+        with patch('app.logger.config') as mock_config:
+            mock_config.log_file = tmp_path / "same.log"
+            mock_config.default_encoding = 'utf-8'
+            logger = Logger()
+            file_handler = Logger._listener.handlers[0].target
+            
+            logger._initialize_logger()
+            assert Logger._listener.handlers[0].target is file_handler
+            
+            mock_config.log_file = tmp_path / "other.log"
+            logger._initialize_logger()
+            assert Logger._listener.handlers[0].target is not file_handler
+            assert list(Logger._handler_cache) == [(str(tmp_path / "other.log"), 'utf-8')]
+        
+        Logger.shutdown()
+        assert Logger._handler_cache == {}
+    
+    @pytest.mark.fresh_logger
+    def test_test_mode_uses_null_handler(self, monkeypatch):
+        """Test CALCULATOR_TEST_MODE replaces the real handlers with a NullHandler"""
+        monkeypatch.setenv('CALCULATOR_TEST_MODE', '1')
+        
+        logger = Logger()
+        
+        assert [type(h) for h in logger.logger.handlers] == [logging.NullHandler]
+        assert Logger._listener is None
+    
+    def test_wrappers_support_lazy_arguments(self, caplog):
+        """Test the wrappers pass %-style arguments through to logging"""
+        logger = Logger()
+        
+        with caplog.at_level(logging.INFO, logger='CalculatorApp'):
+            logger.info("Loaded %d calculations", 3)
+        
+        assert caplog.records[-1].getMessage() == "Loaded 3 calculations"
+    
+    def test_log_calculation_defers_formatting(self, caplog):
+        """Test log_calculation hands the calculation over unformatted"""
+        logger = Logger()
+        calc = Mock()
+        calc.__str__ = Mock(return_value="2 + 2 = 4")
+        
+        with caplog.at_level(logging.INFO, logger='CalculatorApp'):
+            logger.log_calculation(calc)
+        
+        record = caplog.records[-1]
+        assert record.args == (calc,)
+        assert record.getMessage() == "Calculation performed: 2 + 2 = 4"
+    
+    def test_buffered_file_handler_flushes_on_warning(self, tmp_path):
+        """Test INFO records are not flushed but WARNING records are"""
+        from app.logger import BufferedFileHandler
+        
+        handler = BufferedFileHandler(tmp_path / "app.log", delay=True)
+        try:
+            with patch.object(logging.FileHandler, 'flush') as mock_flush:
+                handler.emit(logging.makeLogRecord({'msg': 'info', 'levelno': logging.INFO}))
+                mock_flush.assert_not_called()
+                
+                handler.emit(logging.makeLogRecord({'msg': 'warn', 'levelno': logging.WARNING}))
+                mock_flush.assert_called_once()
+        finally:
+            handler.close()
+        
+        assert (tmp_path / "app.log").read_text() == "info\nwarn\n"
\ No newline at end of file
@@ -4,6 +4,7 @@ Tests for operations
 import pytest
 import math
 from app.operations import (
+    Operation,
     OperationFactory,
     AddOperation,
     SubtractOperation,
@@ -41,10 +42,6 @@ class TestAddOperation:
         op = AddOperation()
         result = op.execute(5, 0)
         assert result == 5
-    
-    def test_add_symbol(self):
-        op = AddOperation()
-        assert op.get_symbol() == "+"
 
 
 class TestSubtractOperation:
@@ -59,10 +56,6 @@ class TestSubtractOperation:
         op = SubtractOperation()
         result = op.execute(3, 10)
         assert result == -7
-    
-    def test_subtract_symbol(self):
-        op = SubtractOperation()
-        assert op.get_symbol() == "-"
 
 
 class TestMultiplyOperation:
@@ -82,10 +75,6 @@ class TestMultiplyOperation:
         op = MultiplyOperation()
         result = op.execute(-4, 5)
         assert result == -20
-    
-    def test_multiply_symbol(self):
-        op = MultiplyOperation()
-        assert op.get_symbol() == "*"
 
 
 class TestDivideOperation:
@@ -105,10 +94,6 @@ class TestDivideOperation:
         op = DivideOperation()
         result = op.execute(10, 3)
         assert abs(result - 3.3333333333) < 0.0001
-    
-    def test_divide_symbol(self):
-        op = DivideOperation()
-        assert op.get_symbol() == "/"
 
 
 class TestPowerOperation:
@@ -128,10 +113,6 @@ class TestPowerOperation:
         op = PowerOperation()
         result = op.execute(-2, 3)
         assert result == -8
-    
-    def test_power_symbol(self):
-        op = PowerOperation()
-        assert op.get_symbol() == "^"
 
 
 class TestRootOperation:
@@ -147,7 +128,7 @@ class TestRootOperation:
         """Test calculating cube root"""
         op = RootOperation()
         result = op.execute(27, 3)
-        assert pytest.approx(result, 0.0001) == 3.0
+        assert math.isclose(result, 3.0, rel_tol=0.0001)
     
     def test_root_negative_base_odd_root(self):
         """Test negative base with odd root"""
@@ -173,11 +154,6 @@ class TestRootOperation:
         op = RootOperation()
         with pytest.raises(OperationError):
             op.execute(16, -2)
-    
-    def test_root_symbol(self):
-        """Test operation symbol"""
-        op = RootOperation()
-        assert op.get_symbol() == "√"
 
 
 class TestModulusOperation:
@@ -192,10 +168,6 @@ class TestModulusOperation:
         op = ModulusOperation()
         with pytest.raises(DivisionByZeroError):
             op.execute(10, 0)
-    
-    def test_modulus_symbol(self):
-        op = ModulusOperation()
-        assert op.get_symbol() == "%"
 
 
 class TestIntegerDivideOperation:
@@ -206,14 +178,27 @@ class TestIntegerDivideOperation:
         result = op.execute(10, 3)
         assert result == 3.0
     
+    def test_int_divide_floats_returns_float(self):
+        op = IntegerDivideOperation()
+        result = op.execute(7.5, 2.0)
+        assert result == 3.0
+        assert isinstance(result, float)
+    
+    @pytest.mark.parametrize("a, b", [(10, 3), (0.0, -5.0), (-0.0, 5.0)])
+    def test_int_divide_returns_plain_float(self, a, b):
+        result = IntegerDivideOperation().execute(a, b)
+        assert isinstance(result, float)
+        assert math.copysign(1.0, result) == 1.0
+    
+    @pytest.mark.parametrize("a, b", [(math.inf, 1.0), (-math.inf, 2.0), (math.nan, 1.0)])
+    def test_int_divide_non_finite_result(self, a, b):
+        with pytest.raises(OperationError):
+            IntegerDivideOperation().execute(a, b)
+    
     def test_int_divide_by_zero(self):
         op = IntegerDivideOperation()
         with pytest.raises(DivisionByZeroError):
             op.execute(10, 0)
-    
-    def test_int_divide_symbol(self):
-        op = IntegerDivideOperation()
-        assert op.get_symbol() == "//"
 
 
 class TestPercentageOperation:
@@ -228,10 +213,6 @@ class TestPercentageOperation:
         op = PercentageOperation()
         with pytest.raises(DivisionByZeroError):
             op.execute(50, 0)
-    
-    def test_percentage_symbol(self):
-        op = PercentageOperation()
-        assert op.get_symbol() == "%%"
 
 
 class TestAbsoluteDifferenceOperation:
@@ -246,10 +227,6 @@ class TestAbsoluteDifferenceOperation:
         op = AbsoluteDifferenceOperation()
         result = op.execute(-5, -10)
         assert result == 5
-    
-    def test_abs_diff_symbol(self):
-        op = AbsoluteDifferenceOperation()
-        assert op.get_symbol() == "|a-b|"
 
 
 class TestOperationFactory:
@@ -259,6 +236,16 @@ class TestOperationFactory:
         op = OperationFactory.create_operation("add")
         assert isinstance(op, AddOperation)
     
+    def test_create_operation_returns_shared_instance(self):
+        op = OperationFactory.create_operation("add")
+        assert OperationFactory.create_operation("ADD") is op
+    
+    def test_describe_operation_by_name_or_symbol(self):
+        assert OperationFactory.describe("add") == ("add", "+")
+        assert OperationFactory.describe("+") == ("add", "+")
+        assert OperationFactory.describe("%%") == ("percent", "%%")
+        assert OperationFactory.describe("unknown") == ("unknown", "unknown")
+    
     def test_create_operation_invalid(self):
         with pytest.raises(OperationError):
             OperationFactory.create_operation("invalid")
@@ -271,10 +258,37 @@ class TestOperationFactory:
         ]
         assert set(operations) == set(expected)
     
+    @pytest.mark.parametrize("operation_class,symbol", [
+        (AddOperation, "+"),
+        (SubtractOperation, "-"),
+        (MultiplyOperation, "*"),
+        (DivideOperation, "/"),
+        (PowerOperation, "^"),
+        (RootOperation, "√"),
+        (ModulusOperation, "%"),
+        (IntegerDivideOperation, "//"),
+        (PercentageOperation, "%%"),
+        (AbsoluteDifferenceOperation, "|a-b|"),
+    ])
+    def test_operation_symbol(self, operation_class, symbol):
+        assert operation_class().get_symbol() == symbol
+    
     def test_create_all_operations(self):
         operations = OperationFactory.get_available_operations()
         for op_name in operations:
             op = OperationFactory.create_operation(op_name)
             assert op is not None
             assert hasattr(op, 'execute')
-            assert hasattr(op, 'get_symbol')
\ No newline at end of file
+            assert hasattr(op, 'get_symbol')
+    
+    def test_operations_have_no_instance_dict(self):
+        for op_name in OperationFactory.get_available_operations():
+            op = OperationFactory.create_operation(op_name)
+            assert not hasattr(op, '__dict__')
+    
+    def test_base_operation_methods_not_implemented(self):
+        op = Operation()
+        with pytest.raises(NotImplementedError):
+            op.execute(1, 2)
+        with pytest.raises(NotImplementedError):
+            op.get_symbol()
\ No newline at end of file
@@ -14,6 +14,19 @@ class TestInputValidator:
         result = InputValidator.validate_number("42.5", "test_param")
         assert result == 42.5
     
+    @pytest.mark.parametrize("value,expected", [
+        ("-3", -3.0),
+        ("2.", 2.0),
+        ("1e3", 1000.0),
+        ("-2.5E-2", -0.025),
+        (".5", 0.5),
+        ("+7", 7.0),
+        (" 8 ", 8.0),
+    ])
+    def test_validate_number_accepted_spellings(self, value, expected):
+        """Test regex fast path and float() fallback accept the same inputs"""
+        assert InputValidator.validate_number(value, "test_param") == expected
+    
     def test_validate_number_invalid_string(self):
         """Test that non-numeric string raises ValidationError"""
         with pytest.raises(ValidationError) as exc_info:
@@ -27,21 +40,29 @@ class TestInputValidator:
             import app.input_validator
             original_max = app.input_validator.config.max_input_value
             app.input_validator.config.max_input_value = 100
+            InputValidator.reload()
             try:
                 InputValidator.validate_number("200", "test_param")
             finally:
                 app.input_validator.config.max_input_value = original_max
+                InputValidator.reload()
         assert "exceeds maximum" in str(exc_info.value).lower()
     
+    def test_reload_picks_up_config_change(self):
+        """Test that reload refreshes the cached maximum input value"""
+        import app.input_validator
+        original_max = app.input_validator.config.max_input_value
+        try:
+            app.input_validator.config.max_input_value = 500
+            assert InputValidator.reload() == 500
+            assert InputValidator.validate_number("400", "test_param") == 400
+        finally:
+            app.input_validator.config.max_input_value = original_max
+            InputValidator.reload()
+    
     def test_validate_operation_valid(self):
         """Test validating valid operation"""
-        # This should not raise an exception for valid operations
-        try:
-            result = InputValidator.validate_operation("add")
-            assert result == "add"
-        except ValidationError:
-            # If it raises, that's also acceptable depending on implementation
-            pass
+        assert InputValidator.validate_operation("add") == "add"
     
     def test_validate_operation_invalid(self):
         """Test validating invalid operation"""